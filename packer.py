@@ -2,13 +2,15 @@ import pyaket
 from pyaket import PyaketProject
 from pyaket.targets import Target
 
-for target in Target.recommended():
-    project = PyaketProject()
-    project.app.name      = "Pyaket"
-    project.app.author    = "BrokenSource"
-    project.app.about     = pyaket.__about__
-    project.app.version   = pyaket.__version__
-    project.entry.module  = pyaket.__package__
-    project.build.target  = target
-    project.build.profile = "smallest"
-    project.compile()
+project = PyaketProject()
+project.app.name      = "Pyaket"
+project.app.author    = "BrokenSource"
+project.app.about     = pyaket.__about__
+project.app.version   = pyaket.__version__
+project.entry.module  = pyaket.__package__
+project.build.profile = "smallest"
+
+results = project.matrix(targets=Target.recommended())
+
+if not all(result.release for result in results):
+    raise SystemExit(1)
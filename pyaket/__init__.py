@@ -1,13 +1,11 @@
-from dearlog import logger  # isort: split
-
 __about__   = "📦 Easy Python to Fast Executables"
 __package__ = "pyaket"
 __version__ = "0.11.0"
 __license__ = "MIT OR Apache-2.0"
 
-import contextlib
-import os
+import importlib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 package: Path = Path(__file__).parent.resolve()
 """Path to the pyaket python package"""
@@ -18,22 +16,46 @@ manifest: Path = (package/"Cargo.toml")
 resources: Path = (package/"resources")
 """Path to pyaket's resources directory"""
 
-from pyaket.project import (
-    CargoProfile,
-    CargoWrapper,
-    PyaketApplication,
-    PyaketBuild,
-    PyaketDependencies,
-    PyaketDirectories,
-    PyaketEntry,
-    PyaketProject,
-    PyaketPython,
-    PyaketTorch,
+# Heavy modules are only imported when first used, keeps the cli fast
+_lazy: dict[str, str] = dict(
+    logger             = "dearlog",
+    CargoProfile       = "pyaket.project",
+    CargoWrapper       = "pyaket.project",
+    PyaketApplication  = "pyaket.project",
+    PyaketBuild        = "pyaket.project",
+    PyaketDependencies = "pyaket.project",
+    PyaketDirectories  = "pyaket.project",
+    PyaketEntry        = "pyaket.project",
+    PyaketProject      = "pyaket.project",
+    PyaketPython       = "pyaket.project",
+    PyaketRelease      = "pyaket.project",
+    PyaketStage        = "pyaket.project",
+    PyaketTimings      = "pyaket.project",
+    PyaketTorch        = "pyaket.project",
+    Target             = "pyaket.targets",
 )
-from pyaket.targets import Target
 
-# Ensure ziglang binary can be found
-with contextlib.suppress(ImportError):
-    import ziglang
-    _package = Path(ziglang.__file__).parent
-    os.environ["PATH"] += f"{os.pathsep}{_package}"
+def __getattr__(name: str):
+    if (module := _lazy.get(name)):
+        globals()[name] = getattr(importlib.import_module(module), name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+if TYPE_CHECKING:
+    from dearlog import logger
+    from pyaket.project import (
+        CargoProfile,
+        CargoWrapper,
+        PyaketApplication,
+        PyaketBuild,
+        PyaketDependencies,
+        PyaketDirectories,
+        PyaketEntry,
+        PyaketProject,
+        PyaketPython,
+        PyaketRelease,
+        PyaketStage,
+        PyaketTimings,
+        PyaketTorch,
+    )
+    from pyaket.targets import Target
@@ -1,23 +1,33 @@
 import sys
-from contextlib import nullcontext
-
-from cyclopts import App
-from parsenaut._cyclopts import Launcher
 
 import pyaket
-from pyaket import (
-    PyaketApplication,
-    PyaketBuild,
-    PyaketDependencies,
-    PyaketDirectories,
-    PyaketEntry,
-    PyaketProject,
-    PyaketPython,
-    PyaketTorch,
-)
 
 
 def main():
+
+    # Skip importing the whole cli for quick queries
+    if (sys.argv[1:] == ["--version"]):
+        print(pyaket.__version__)
+        return
+
+    from contextlib import nullcontext
+
+    from cyclopts import App
+    from parsenaut._cyclopts import Launcher
+
+    from pyaket import (
+        PyaketApplication,
+        PyaketBuild,
+        PyaketDependencies,
+        PyaketDirectories,
+        PyaketEntry,
+        PyaketProject,
+        PyaketPython,
+        PyaketTorch,
+        toolchain,
+        tracing,
+    )
+
     app: App = Launcher.chain(App(
         result_action="return_value",
         help_flags=["--help"],
@@ -39,5 +49,13 @@ def main():
     with nullcontext("🟢 Building") as panel:
         app.command(PyaketBuild, name="build", group=panel, result_action=lambda x: setattr(project, "build", x))
         app.command(project.compile, name="compile", group=panel)
+        app.command(project.matrix,  name="matrix",  group=panel)
+
+    with nullcontext("🔵 Tools") as panel:
+        app.command(toolchain.main, name="toolchain", group=panel)
+        app.command(tracing.main,   name="trace",     group=panel)
+
+    app.meta(sys.argv[1:])
 
-    app.meta(sys.argv[1:])
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import functools
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel
+
+import pyaket
+from pyaket import files, logger
+
+# Index updates from parallel builds (matrix)
+_lock = threading.Lock()
+
+@functools.cache
+def crate_digest() -> str:
+    """Hash of pyaket's rust crate version and sources, anything that changes the binary"""
+    sha = hashlib.sha256(pyaket.__version__.encode())
+    for file in sorted((
+        pyaket.manifest,
+        pyaket.package/"build.rs",
+        pyaket.package/".cargo"/"config.toml",
+        pyaket.resources/"zygote.py",
+        *(pyaket.package/"pyaket").rglob("*.rs"),
+    )):
+        if file.exists():
+            sha.update(file.relative_to(pyaket.package).as_posix().encode())
+            sha.update(file.read_bytes())
+    return sha.hexdigest()
+
+# ---------------------------------------------------------------------------- #
+
+class PyaketCache(BaseModel):
+    """Content-addressed store of compiled binaries, skips cargo on identical builds"""
+
+    root: Path
+    """Directory holding the index and cached binaries"""
+
+    limit: int = (4 * 1024**3)
+    """Maximum total size of cached binaries in bytes, least recently used are evicted"""
+
+    @property
+    def index_file(self) -> Path:
+        return (self.root/"index.json")
+
+    def blob(self, key: str) -> Path:
+        return (self.root/"blobs"/key[:2]/key)
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.index_file.read_text("utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return dict(hits=0, misses=0, entries={})
+
+    def _save(self, index: dict) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(index, indent=2), "utf-8")
+        os.replace(temp, self.index_file)
+
+    # ------------------------------------------------------------------------ #
+
+    def get(self, key: str, release: Path) -> Optional[dict]:
+        """Copy a cached binary to the release path, returns its entry on hit"""
+        with _lock:
+            index = self._load()
+            entry = index["entries"].get(key)
+
+            if (entry is None) or (not self.blob(key).exists()):
+                index["entries"].pop(key, None)
+                index["misses"] += 1
+                self._save(index)
+                logger.info(f"Build cache miss ({key[:12]})")
+                return None
+
+            files.clone(self.blob(key), release, hardlink=False)
+            entry["accessed"] = time.time()
+            index["hits"] += 1
+            self._save(index)
+
+        logger.ok(f"Build cache hit ({key[:12]}), skipping cargo")
+        return entry
+
+    def put(self, key: str, binary: Path, **metadata) -> None:
+        """Store a compiled binary under a key, evicting old entries over the limit"""
+        with _lock:
+            blob = self.blob(key)
+            files.clone(binary, blob, hardlink=False)
+
+            index = self._load()
+            index["entries"][key] = dict(
+                name=binary.name,
+                size=blob.stat().st_size,
+                created=time.time(),
+                accessed=time.time(),
+                **metadata,
+            )
+            self._evict(index)
+            self._save(index)
+
+    def _evict(self, index: dict) -> None:
+        entries: dict = index["entries"]
+        total = sum(entry["size"] for entry in entries.values())
+
+        for key in sorted(entries, key=lambda key: entries[key]["accessed"]):
+            if total <= self.limit:
+                break
+            logger.info(f"Build cache evicting {entries[key]['name']} ({key[:12]})")
+            self.blob(key).unlink(missing_ok=True)
+            total -= entries.pop(key)["size"]
+
+    def clear(self) -> None:
+        """Delete all cached binaries and the index"""
+        with _lock:
+            shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,105 @@
+import contextlib
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Linux ioctl for copy-on-write clones (btrfs, xfs, bcachefs, etc)
+FICLONE: int = 0x40049409
+
+def sha256(path: Path) -> str:
+    """Streaming sha256 hex digest of a file"""
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+def reflink(source: Path, target: Path) -> bool:
+    """Copy-on-write clone a file, returns false when unsupported"""
+    if sys.platform != "linux":
+        return False
+
+    import fcntl
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError:
+            pass
+
+    target.unlink()
+    return False
+
+def _copy_file_range(src: int, dst: int, size: int) -> None:
+    offset = 0
+    while (offset < size) and (sent := os.copy_file_range(src, dst, size - offset, offset, offset)):
+        offset += sent
+    if (offset < size):
+        raise OSError("Short copy_file_range")
+
+def _sendfile(src: int, dst: int, size: int) -> None:
+    offset = 0
+    while (offset < size) and (sent := os.sendfile(dst, src, offset, size - offset)):
+        offset += sent
+    if (offset < size):
+        raise OSError("Short sendfile")
+
+def stream(source: Path, target: Path) -> None:
+    """Copy a file's contents in kernel space whenever possible"""
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+
+        for method in (_copy_file_range, _sendfile):
+            with contextlib.suppress(OSError, AttributeError):
+                return method(src.fileno(), dst.fileno(), size)
+            dst.seek(0)
+            dst.truncate()
+
+        shutil.copyfileobj(src, dst, length=(1024**2))
+
+def clone(source: Path, target: Path, hardlink: bool=True) -> bool:
+    """
+    Duplicate a file without reading it in python, in order of preference:
+    reflink, hardlink (if allowed), kernel streaming copy
+
+    Returns true if no data was copied, the files share storage
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.unlink(missing_ok=True)
+
+    if reflink(source, target):
+        shutil.copymode(source, target)
+        return True
+
+    if hardlink:
+        with contextlib.suppress(OSError):
+            os.link(source, target)
+            return True
+
+    stream(source, target)
+    shutil.copymode(source, target)
+    return False
+
+def zstd(source: Path, target: Path, level: int, dictionary: Optional[Path]=None) -> None:
+    """Compress a file with zstd, optionally with a trained dictionary"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    if (tool := shutil.which("zstd")):
+        subprocess.check_call((
+            tool, f"-{level}", "--ultra", "-T0", "-q", "-f",
+            *(("-D", str(dictionary)) if dictionary else ()),
+            str(source), "-o", str(target),
+        ))
+        return
+
+    try:
+        from compression import zstd # type: ignore
+    except ImportError:
+        raise RuntimeError("Zstd assets need the 'zstd' command or Python 3.14+")
+
+    with open(source, "rb") as src, zstd.ZstdFile(target, mode="wb",
+        level=level, zstd_dict=(zstd.ZstdDict(dictionary.read_bytes()) if dictionary else None),
+    ) as dst:
+        shutil.copyfileobj(src, dst, length=(1024**2))
@@ -1,20 +1,36 @@
+import contextlib
+import gzip
+import hashlib
+import itertools
+import json
+import lzma
 import os
+import re
+import shutil
+import struct
 import subprocess
 import sys
 import tarfile
+import threading
+import time
 import tomllib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Iterable, Optional
+from typing import IO, Iterable, Iterator, Optional
 
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator
 
 import pyaket
-from pyaket import logger
+from pyaket import files, logger, toolchain
+from pyaket.cache import PyaketCache, crate_digest
 from pyaket.targets import Target
 
+PAYLOAD_MAGIC: bytes = b"PYAKET\x00\x01"
+"""Ends the payload appended to stub releases, versioned by the last byte"""
+
 # ---------------------------------------------------------------------------- #
 
 class PyaketApplication(BaseModel):
@@ -53,9 +69,21 @@ class PyaketDependencies(BaseModel):
     rolling: bool = False
     """Always upgrade dependencies at startup"""
 
+    rolling_ttl: int = 0
+    """Minimum seconds between rolling upgrades, zero upgrades at every launch (hourly in background)"""
+
+    rolling_background: bool = False
+    """Upgrade rolling dependencies detached, swapped in at the next launch with no other instance running (unix)"""
+
     standalone: bool = False
     """Bundle all dependencies in a single executable"""
 
+    pin: bool = Field(default=False, exclude=True)
+    """Resolve dependencies at build time to exact versions with hashes, installed without resolution"""
+
+    lockfile: Optional[Path] = Field(default=None, exclude=True)
+    """A uv.lock or pylock.toml to pin dependencies from instead of resolving, implies pin"""
+
     def unwheel(self) -> Iterable[Path]:
         for path in map(Path, self.wheels):
             if path.is_file():
@@ -66,6 +94,94 @@ class PyaketDependencies(BaseModel):
             elif "*" in path.name:
                 yield from Path(path.parent).glob(path.name)
 
+    def lock(self, python: str) -> Optional[str]:
+        """Pinned requirements with hashes for all platforms, if pinning is enabled"""
+
+        # Free-threaded builds resolve as the same version
+        python = python.rstrip("t")
+
+        if (self.lockfile is not None):
+            lockfile = Path(self.lockfile)
+
+            # Local packages come from the bundled wheels
+            if (lockfile.name == "uv.lock"):
+                return self._local(self._uv(
+                    "export", "--frozen", "--no-dev", "--no-emit-project",
+                    "--format", "requirements-txt", "--no-header", "--no-annotate",
+                    "--project", str(lockfile.parent),
+                ))
+
+            if lockfile.name.startswith("pylock") and (lockfile.suffix == ".toml"):
+                return self._pylock(lockfile)
+
+            raise ValueError(f"Unknown lockfile format: {lockfile}")
+
+        if not self.pin:
+            return None
+
+        # Bundled wheels are resolved for their dependencies, but installed from assets
+        requirements = "\n".join((*self.pypi, *map(str, self.unwheel())))
+        return self._local(self._uv(
+            "pip", "compile", "-", "--universal", "--generate-hashes",
+            "--python-version", python, "--no-header", "--no-annotate", "--quiet",
+            input=requirements,
+        ))
+
+    @staticmethod
+    def name(requirement: str) -> Optional[str]:
+        """PEP 503 normalized project name of a requirement or distribution file"""
+        if (match := re.match(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)) is None:
+            return None
+        return re.sub(r"[-_.]+", "-", match.group(1)).lower()
+
+    @staticmethod
+    def requirements(text: str) -> Iterable[str]:
+        """Logical requirement lines of a requirements file, joining continuations"""
+        for line in text.replace("\\\n", " ").splitlines():
+            if (line := line.strip()) and not line.startswith(("#", "-")):
+                yield line
+
+    @staticmethod
+    def _uv(*args: str, input: Optional[str]=None) -> str:
+        if not (uv := shutil.which("uv")):
+            raise RuntimeError("Pinning dependencies needs the 'uv' command")
+        return subprocess.run((uv, *args),
+            input=input, capture_output=True,
+            text=True, check=True,
+        ).stdout
+
+    @staticmethod
+    def _local(requirements: str) -> str:
+        """Remove requirements of local files and directories, including their hash continuation lines"""
+        lines = list()
+        for line in requirements.replace("\\\n", "\0").splitlines():
+            entry = line.strip()
+            if ("@ file:" in entry) or entry.startswith(("-e ", "--editable", ".", "/", "~", "file:")):
+                continue
+            if re.match(r"^[A-Za-z]:[\\/]", entry):
+                continue
+            lines.append(line.replace("\0", "\\\n"))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _pylock(path: Path) -> str:
+        """Convert a PEP 751 pylock.toml to a hashed requirements file"""
+        data = tomllib.loads(Path(path).read_text("utf-8"))
+        lines = list()
+
+        for package in data.get("packages", []):
+            if not (version := package.get("version")):
+                continue # Directories, vcs
+            hashes = [
+                f"--hash={algorithm}:{digest}"
+                for artifact in (*package.get("wheels", []), package.get("sdist") or {})
+                for algorithm, digest in artifact.get("hashes", {}).items()
+            ]
+            marker = (f" ; {marker}" if (marker := package.get("marker")) else "")
+            lines.append(" \\\n    ".join((f"{package['name']}=={version}{marker}", *hashes)))
+
+        return "\n".join(lines) + "\n"
+
 # ---------------------------------------------------------------------------- #
 
 class PyaketDirectories(BaseModel):
@@ -88,6 +204,12 @@ class PyaketPython(BaseModel):
     bundle: bool = False
     """Whether to bundle python in the executable"""
 
+    bytecode: bool = False
+    """Precompile bytecode of the environment in parallel when installing"""
+
+    warmup: bool = False
+    """Import the entry module once after installing, to populate caches"""
+
 # ---------------------------------------------------------------------------- #
 
 class PyaketTorch(BaseModel):
@@ -110,6 +232,15 @@ class PyaketEntry(BaseModel):
     command: Optional[str] = None
     """A command to run at runtime (command ...)"""
 
+    zygote: bool = False
+    """Fork module launches from a resident interpreter with preloaded imports (unix)"""
+
+    preload: list[str] = Field(default_factory=list)
+    """Modules imported once by the zygote, defaults to the entry module"""
+
+    idle: int = 600
+    """Seconds without launches before the zygote exits"""
+
 # ---------------------------------------------------------------------------- #
 
 class CargoProfile(str, Enum):
@@ -138,6 +269,95 @@ class CargoWrapper(str, Enum):
             yield "build"
 
 
+class TarballCodec(str, Enum):
+    Gzip = "gz"
+    Xz   = "xz"
+    Zstd = "zst"
+
+    @property
+    def level(self) -> int:
+        """Default compression level"""
+        return {
+            self.Gzip: 9,
+            self.Xz:   6,
+            self.Zstd: 19,
+        }[self]
+
+    def command(self, level: int) -> Optional[tuple[str, ...]]:
+        """Multithreaded compressor reading stdin to stdout, if installed"""
+        tool, *flags = {
+            self.Gzip: ("pigz", f"-{level}", "-c"),
+            self.Xz:   ("xz",   f"-{level}", "-c", "-T0"),
+            self.Zstd: ("zstd", f"-{level}", "-c", "-T0", "-q", "--ultra"),
+        }[self]
+        if (path := shutil.which(tool)):
+            return (path, *flags)
+        return None
+
+    def python(self, fileobj: IO[bytes], level: int) -> IO[bytes]:
+        """Fallback compressor writing to a file object"""
+        if (self is self.Gzip):
+            return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=level)
+        if (self is self.Xz):
+            return lzma.LZMAFile(fileobj, mode="wb", preset=level)
+        try:
+            from compression import zstd # type: ignore
+        except ImportError:
+            raise RuntimeError("Zstd tarballs need the 'zstd' command or Python 3.14+")
+        return zstd.ZstdFile(fileobj, mode="wb", options={
+            zstd.CompressionParameter.compression_level: level,
+            zstd.CompressionParameter.nb_workers: (os.cpu_count() or 1),
+        })
+
+    def compress(self, source: Path, output: Path, level: Optional[int]=None) -> str:
+        """Stream a tarball of a file through the codec, returns the sha256 of the output"""
+        level = (self.level if (level is None) else level)
+        sha = hashlib.sha256()
+
+        with open(output, "wb") as file:
+            try:
+                if (command := self.command(level)):
+                    process = subprocess.Popen(command,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                    )
+
+                    def feed() -> None:
+                        with process.stdin, tarfile.open(fileobj=process.stdin, mode="w|") as archive:
+                            archive.add(source, arcname=source.name)
+
+                    thread = threading.Thread(target=feed, daemon=True)
+                    thread.start()
+
+                    # Hash the compressed data as it's written
+                    while (chunk := process.stdout.read(1024**2)):
+                        sha.update(chunk)
+                        file.write(chunk)
+
+                    thread.join()
+                    if (process.wait() != 0):
+                        raise subprocess.CalledProcessError(process.returncode, command)
+
+                else:
+                    class Writer:
+                        def write(self, data: bytes) -> int:
+                            sha.update(data)
+                            return file.write(data)
+                        def flush(self) -> None:
+                            file.flush()
+
+                    with self.python(Writer(), level) as stream, \
+                        tarfile.open(fileobj=stream, mode="w|") as archive:
+                        archive.add(source, arcname=source.name)
+            except BaseException:
+                file.close()
+                output.unlink(missing_ok=True)
+                raise
+
+        return sha.hexdigest()
+
+# ---------------------------------------------------------------------------- #
+
 class PyaketBuild(BaseModel):
     """Release configuration for the application"""
 
@@ -165,6 +385,10 @@ class PyaketBuild(BaseModel):
             logger.info(f"• You can opt-out of it by setting {_FLAG}=0")
             self.cargo = CargoWrapper.Zig
 
+    def toolchain(self) -> None:
+        """Ensure the host and target rust toolchains are installed"""
+        toolchain.ensure(self.target.value)
+
     target_dir: Path = Field(
         default=Path(os.getenv("CARGO_TARGET_DIR") or (Path.cwd()/"target")),
         exclude=True)
@@ -178,8 +402,48 @@ class PyaketBuild(BaseModel):
     upx: bool = False
     """Use UPX to compress the binary"""
 
-    tarball: bool = False
-    """Create a .tar.gz for unix releases (preserves chmod +x)"""
+    tarball: Optional[TarballCodec] = None
+    """Create a compressed tarball for unix releases (preserves chmod +x)"""
+
+    @field_validator("tarball", mode="before")
+    @classmethod
+    def _tarball(cls, value):
+        # Compatibility with the boolean option
+        if isinstance(value, bool):
+            return (TarballCodec.Gzip if value else None)
+        return value
+
+    tarball_level: Optional[int] = None
+    """Tarball compression level, defaults to the codec's best practical one"""
+
+    zstd: Optional[int] = None
+    """Compress bundled assets with zstd at this level, decompressed while extracting"""
+
+    zstd_dictionary: Optional[Path] = None
+    """A trained zstd dictionary for bundled assets (`zstd --train`), embedded alongside"""
+
+    checksum: bool = Field(default=True, exclude=True)
+    """Write a sha256sum file next to the release"""
+
+    cache: bool = Field(default=True, exclude=True)
+    """Reuse binaries from identical previous builds, skipping cargo"""
+
+    cache_dir: Path = Field(
+        default=(Path(os.getenv("CARGO_TARGET_DIR") or (Path.cwd()/"target"))/"pyaket"),
+        exclude=True)
+    """Directory of the build cache, shared by all targets and profiles"""
+
+    cache_size: float = Field(default=4.0, exclude=True)
+    """Maximum size of the build cache in gigabytes"""
+
+    stub: bool = Field(default=False, exclude=True)
+    """Append the project and assets to a cached prebuilt runtime, skipping cargo"""
+
+    timings: Optional[Path] = Field(default=None, exclude=True)
+    """Write structured timings of every build stage as json to this path"""
+
+    cargo_timings: bool = Field(default=False, exclude=True)
+    """Pass `--timings` to cargo, the html report path is attached to the timings"""
 
 # ---------------------------------------------------------------------------- #
 
@@ -187,6 +451,21 @@ class PyaketAssets(BaseModel):
     _root = PrivateAttr(default_factory=lambda:
         TemporaryDirectory(prefix=f"{__package__}-"))
 
+    _digests: dict[Path, str] = PrivateAttr(default_factory=dict)
+    """Known sha256 of staged files, relative to root"""
+
+    _sources: dict[Path, tuple] = PrivateAttr(default_factory=dict)
+    """Inputs of compressed staged files, relative to root"""
+
+    copied: int = Field(default=0, exclude=True)
+    """Bytes physically copied while staging"""
+
+    linked: int = Field(default=0, exclude=True)
+    """Bytes staged by reflinks or hardlinks, no data copied"""
+
+    compressed: int = Field(default=0, exclude=True)
+    """Bytes of source files staged compressed"""
+
     @property
     def root(self) -> Path:
         return Path(self._root.name)
@@ -195,6 +474,147 @@ class PyaketAssets(BaseModel):
         path = (self.root / relative)
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(data)
+        self._digests[Path(relative)] = hashlib.sha256(data).hexdigest()
+        self.copied += len(data)
+
+    def copy(self, relative: Path, source: Path) -> None:
+        """Stage a file without loading it in memory, deduplicating identical contents"""
+        relative = Path(relative)
+        path     = (self.root / relative)
+        digest   = files.sha256(source)
+        size     = source.stat().st_size
+
+        # Already staged from a previous build
+        if path.exists() and (self._digests.get(relative) == digest):
+            return
+
+        # Prefer linking to a staged file with the same contents
+        twin = next((other for other, known in self._digests.items()
+            if (known == digest) and (other != relative)), None)
+
+        if (twin is not None) and files.clone(self.root/twin, path):
+            self.linked += size
+        elif files.clone(source, path):
+            self.linked += size
+        else:
+            self.copied += size
+
+        self._digests[relative] = digest
+
+    def sha256(self, relative: Path) -> str:
+        """Digest of a staged file, hashed only if unknown"""
+        if (relative := Path(relative)) not in self._digests:
+            self._digests[relative] = files.sha256(self.root/relative)
+        return self._digests[relative]
+
+    def remove(self, relative: Path) -> None:
+        """Unstage a file, if present"""
+        (self.root / relative).unlink(missing_ok=True)
+        self._digests.pop(Path(relative), None)
+        self._sources.pop(Path(relative), None)
+
+    def compress(self, relative: Path, source: Path, level: int, dictionary: Optional[Path]=None) -> None:
+        """Stage a zstd compressed file, skipped if already staged from the same inputs"""
+        relative = Path(relative)
+        path     = (self.root / relative)
+        inputs   = (files.sha256(source), level, dictionary and files.sha256(dictionary))
+
+        if path.exists() and (self._sources.get(relative) == inputs):
+            return
+
+        files.zstd(source, path, level=level, dictionary=dictionary)
+        self._digests[relative] = files.sha256(path)
+        self._sources[relative] = inputs
+        self.compressed += source.stat().st_size
+        self.copied += path.stat().st_size
+
+    def digest(self) -> str:
+        """Hash of all staged files paths and contents"""
+        sha = hashlib.sha256()
+        for file in sorted(self.root.rglob("*")):
+            if file.is_file():
+                relative = file.relative_to(self.root)
+                sha.update(relative.as_posix().encode())
+                sha.update(bytes.fromhex(self.sha256(relative)))
+        return sha.hexdigest()
+
+# ---------------------------------------------------------------------------- #
+
+class PyaketStage(BaseModel):
+    """Measurements of a single step of a build"""
+
+    name: str
+    """Identifier of the step (toolchain, stage, cache, cargo, upx, etc)"""
+
+    took: float = 0.0
+    """Wall time of the step in seconds"""
+
+    bytes: int = 0
+    """Bytes written or moved by the step"""
+
+    code: Optional[int] = None
+    """Exit status of the step's subprocess, if any"""
+
+    cache: Optional[bool] = None
+    """Whether a cache was hit, for cacheable steps"""
+
+    def call(self, command: tuple[str, ...], **options) -> None:
+        """Run a subprocess recording its exit status, raises on failure"""
+        self.code = subprocess.run(command, **options).returncode
+        if (self.code != 0):
+            raise subprocess.CalledProcessError(self.code, command)
+
+class PyaketTimings(BaseModel):
+    """Structured timings of a compile, ingestible by build dashboards"""
+
+    stages: list[PyaketStage] = Field(default_factory=list)
+    """Steps of the build in execution order, including failed ones"""
+
+    cargo_report: Optional[Path] = None
+    """Html report of `cargo --timings`, when enabled"""
+
+    @computed_field
+    @property
+    def total(self) -> float:
+        return sum(stage.took for stage in self.stages)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[PyaketStage]:
+        """Measure a step's wall time until the context exits"""
+        stage = PyaketStage(name=name)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.took = (time.perf_counter() - start)
+            self.stages.append(stage)
+
+    def dump(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.model_dump_json(indent=2), "utf-8")
+
+# ---------------------------------------------------------------------------- #
+
+class PyaketRelease(BaseModel):
+    """Outcome of a single build in a matrix"""
+
+    target: Target
+    """The rust target platform compiled for"""
+
+    profile: CargoProfile
+    """The build profile used"""
+
+    release: Optional[Path] = None
+    """Path to the final release file, if successful"""
+
+    error: Optional[str] = None
+    """Why the build failed, if it did"""
+
+    took: float = 0.0
+    """Wall time of the build in seconds"""
+
+    timings: Optional[PyaketTimings] = None
+    """Per-stage measurements of the build"""
 
 # ---------------------------------------------------------------------------- #
 
@@ -214,6 +634,9 @@ class PyaketProject(BaseModel):
 
     uuid: str = None # type: ignore
 
+    timings: PyaketTimings = Field(default_factory=PyaketTimings, exclude=True)
+    """Measurements of the last compile, dumped to `build.timings` if set"""
+
     # ------------------------------------------------------------------------ #
 
     def release_name(self) -> str:
@@ -225,7 +648,193 @@ class PyaketProject(BaseModel):
             self.build.target.exe_suffix,
         ))
 
+    def identity(self) -> str:
+        """Deterministic uuid of the installed environment, from the configuration and assets,
+        unchanged rebuilds don't trigger reinstalls at the users"""
+        sha = hashlib.sha256()
+        sha.update(self.model_dump_json(exclude={"uuid", "build"}).encode())
+        sha.update(self.assets.digest().encode())
+        return str(uuid.UUID(hex=sha.hexdigest()[:32]))
+
+    def digest(self) -> str:
+        """Build cache key, hash of everything that goes into a compiled binary"""
+        sha = hashlib.sha256()
+        sha.update(self.model_dump_json(exclude={"uuid"}).encode())
+        sha.update(self.assets.digest().encode())
+        sha.update(crate_digest().encode())
+        self._rustflags(sha)
+        return sha.hexdigest()
+
+    def stub_digest(self) -> str:
+        """Build cache key of the generic runtime, shared by all projects of a target and profile"""
+        sha = hashlib.sha256(b"stub")
+        sha.update(self.build.model_dump_json(include={"target", "profile", "cargo", "upx"}).encode())
+        sha.update(crate_digest().encode())
+        self._rustflags(sha)
+        return sha.hexdigest()
+
+    def _rustflags(self, sha: "hashlib._Hash") -> None:
+        """Compiler flags from the environment"""
+        for key in sorted(self.environ):
+            if (key in ("RUSTFLAGS", "CARGO_ENCODED_RUSTFLAGS")) or key.startswith("CARGO_PROFILE_"):
+                sha.update(f"{key}={self.environ[key]}".encode())
+
+    def stage(self) -> None:
+        """Write all bundled files to the assets directory"""
+
+        # The whole environment is a single archive, nothing else to install
+        if self.standalone:
+            self.assets.remove(Path("lock/requirements.txt"))
+            self.assets.remove(Path("manifest.json"))
+            return self._standalone()
+
+        self.assets.remove(Path("standalone.tar.zst"))
+
+        # Resolve once at build time, the runtime installs without resolution
+        if (lock := self.deps.lock(python=self.python.version)) is not None:
+            self.assets.write(Path("lock/requirements.txt"), lock.encode())
+            logger.info(f"Pinned {lock.count('==')} dependencies with hashes")
+            if self.deps.rolling:
+                logger.warn("Rolling dependencies are ignored when pinned")
+        else:
+            self.assets.remove(Path("lock/requirements.txt"))
+
+        # Only read when decompressing, uncompressed builds don't ship it
+        dictionary = (self.build.zstd_dictionary if (self.build.zstd is not None) else None)
+
+        if (dictionary is not None):
+            self.assets.copy(relative=Path("zstd.dict"), source=dictionary)
+        else:
+            self.assets.remove(Path("zstd.dict"))
+
+        # Fingerprint of every package, the runtime reinstalls only changed ones
+        packages: dict[str, str] = dict()
+
+        if (lock is not None):
+            for requirement in self.deps.requirements(lock):
+                if (name := self.deps.name(requirement)):
+                    packages[name] = hashlib.sha256(requirement.encode()).hexdigest()
+        else:
+            for requirement in self.deps.pypi:
+                if re.match(r"^[a-z]+(\+[a-z]+)?://", requirement):
+                    continue # Direct urls without a name
+                if (name := self.deps.name(requirement)):
+                    packages[name] = requirement
+
+        for wheel in self.deps.unwheel():
+
+            # Toggling compression between builds mustn't bundle both
+            for stale in (f"dist/{wheel.name}", f"dist/{wheel.name}.zst"):
+                if (self.build.zstd is not None) == stale.endswith(".zst"):
+                    continue
+                self.assets.remove(Path(stale))
+
+            if (self.build.zstd is not None):
+                self.assets.compress(
+                    relative=Path(f"dist/{wheel.name}.zst"),
+                    source=wheel,
+                    level=self.build.zstd,
+                    dictionary=dictionary,
+                )
+            else:
+                self.assets.copy(
+                    relative=Path(f"dist/{wheel.name}"),
+                    source=wheel,
+                )
+
+            if (name := self.deps.name(wheel.name.split("-")[0])):
+                packages[name] = self.assets.sha256(Path(f"dist/{wheel.name}"
+                    + (".zst" if (self.build.zstd is not None) else "")))
+
+        self.assets.write(Path("manifest.json"), json.dumps(dict(
+            python=self.python.version,
+            torch=f"{self.torch.version}:{self.torch.backend}",
+            packages=dict(sorted(packages.items())),
+        ), indent=2).encode())
+
+        logger.info((
+            f"Staged assets: {self.assets.linked/1e6:.1f} MB linked, "
+            f"{self.assets.copied/1e6:.1f} MB copied"
+        ))
+
+        if self.assets.compressed:
+            logger.info(f"Compressed {self.assets.compressed/1e6:.1f} MB of assets with zstd")
+
+    @property
+    def standalone(self) -> bool:
+        return (self.build.standalone or self.deps.standalone)
+
+    def _standalone(self) -> None:
+        """Assemble the target's interpreter with all packages installed, staged as one archive"""
+        target = self.build.target
+        system = ("windows" if target.is_windows() else ("macos" if target.is_macos() else "linux"))
+        arch   = target.value.split("-")[0]
+        libc   = (("musl" if ("musl" in target.value) else "gnu") if (system == "linux") else "none")
+
+        # Wheels for windows-gnu are the msvc ones
+        platform = (f"{arch}-pc-windows-msvc" if target.is_windows() else target.value)
+        version  = self.python.version.replace("t", "+freethreaded")
+
+        if not (uv := shutil.which("uv")):
+            raise RuntimeError("Standalone releases need the 'uv' command")
+
+        with TemporaryDirectory(prefix=f"{__package__}-standalone-") as temp:
+            temp = Path(temp)
+
+            logger.info(f"Assembling a standalone python {self.python.version} for {target.value}")
+            subprocess.check_call((
+                uv, "python", "install", "--install-dir", str(temp),
+                f"cpython-{version}-{system}-{arch}-{libc}",
+            ), env=(self.environ | dict(UV_PYTHON_INSTALL_BIN="0")))
+
+            interpreter = next(path for path in temp.glob("cpython-*") if path.is_dir())
+            packages = next(interpreter.glob("lib/python3*/site-packages"), (interpreter/"Lib"/"site-packages"))
+
+            install = [
+                uv, "pip", "install", "--target", str(packages),
+                "--python-version", self.python.version.rstrip("t"),
+                "--python-platform", platform,
+            ]
+
+            if (lock := self.deps.lock(python=self.python.version)) is not None:
+                (requirements := temp/"requirements.txt").write_text(lock)
+                install += ("--no-deps", "-r", str(requirements))
+            else:
+                install += self.deps.pypi
+
+            if (torch := self.torch.version):
+                install += (f"torch=={torch}", "torchvision", "torchaudio",
+                    f"--torch-backend={self.torch.backend}", "--preview")
+
+            subprocess.check_call((*install, *map(str, self.deps.unwheel()), "pip"), env=self.environ)
+
+            # Runtime extracts it in a single stream, forget the previous digest
+            self.assets.remove(Path("standalone.tar.zst"))
+            archive = (self.assets.root/"standalone.tar.zst")
+            archive.parent.mkdir(parents=True, exist_ok=True)
+            TarballCodec.Zstd.compress(interpreter, archive,
+                level=(self.build.zstd or TarballCodec.Zstd.level))
+            self.assets.copied += archive.stat().st_size
+
+        logger.info(f"Staged standalone environment: {archive.stat().st_size/1e6:.1f} MB")
+
     def compile(self) -> Path:
+        self.timings = PyaketTimings()
+
+        try:
+            with self.timings.stage("toolchain"):
+                self.build.toolchain()
+            with self.timings.stage("stage") as stage:
+                before = (self.assets.copied + self.assets.linked)
+                self.stage()
+                stage.bytes = (self.assets.copied + self.assets.linked - before)
+            return self._compile()
+        finally:
+            if self.build.timings:
+                self.timings.dump(self.build.timings)
+
+    def _compile(self) -> Path:
+        """Build a release from the current toolchain and staged assets"""
         logger.info(f"Compiling for {self.build.target.description}")
 
         # Complaints session
@@ -240,30 +849,20 @@ class PyaketProject(BaseModel):
 
         # Todo: Auto zigbuild, xwin method
 
-        # Must have the host and target toolchain
-        subprocess.check_call(("rustup", "set", "profile", "minimal"))
-        subprocess.check_call(("rustup", "default", "stable"))
-        subprocess.check_call(("rustup", "target", "add", self.build.target.value))
-
-        # All binaries are unique
-        self.uuid = str(uuid.uuid4())
-
-        # Fixme (standalone)
-        if self.build.standalone:
-            raise NotImplementedError((
-                "Standalone releases aren't implemented, awaiting:\n"
-                "• https://github.com/astral-sh/uv/issues/1681"
-            ))
+        # Same environment, same identity
+        self.uuid = self.identity()
 
         # https://github.com/rust-cross/cargo-zigbuild/issues/329
         if sys.platform == "darwin":
             subprocess.run(("ulimit", "-n", "8192"))
 
-        for wheel in self.deps.unwheel():
-            self.assets.write(
-                relative=Path(f"dist/{wheel.name}"),
-                data=wheel.read_bytes(),
-            )
+        self.build.autocargo()
+
+        # Ensure ziglang binary can be found
+        if (self.build.cargo is CargoWrapper.Zig):
+            with contextlib.suppress(ImportError):
+                import ziglang
+                self.environ["PATH"] += f"{os.pathsep}{Path(ziglang.__file__).parent}"
 
         # Export isolated environment
         self.environ.update(dict(
@@ -280,43 +879,226 @@ class PyaketProject(BaseModel):
         for file in self.assets.root.rglob("*"):
             logger.info(f"Asset: {file}")
 
-        self.build.autocargo()
-        subprocess.check_call((
-            "cargo", *self.build.cargo.build,
-            "--manifest-path", str(pyaket.manifest),
-            "--profile", self.build.profile.value,
-            "--target", self.build.target.value,
-            "--target-dir", str(self.build.target_dir),
-        ), env=self.environ, cwd=pyaket.package)
-
-        # Find the compiled binary
-        binary = next(
-            (self.build.target_dir/self.build.target.value/self.build.profile.value)
-            .glob(("pyaket" + self.build.target.exe_suffix))
-        )
-
-        # Rename the compiled binary to the final release name
         release = (self.build.output / self.release_name())
         release.parent.mkdir(parents=True, exist_ok=True)
-        release.write_bytes(binary.read_bytes())
-        release.chmod(0o755)
-        binary.unlink()
 
-        if self.build.upx:
-            subprocess.check_call(("upx", "--best", "--lzma", str(release)))
+        cache = PyaketCache(
+            root=self.build.cache_dir,
+            limit=int(self.build.cache_size * 1024**3),
+        )
 
-        # Release a tar.gz to keep chmod +x attributes
+        def lookup(key: str) -> Optional[dict]:
+            with self.timings.stage("cache") as stage:
+                if (entry := cache.get(key, release)):
+                    stage.bytes = release.stat().st_size
+                stage.cache = bool(entry)
+                return entry
+
+        # Generic runtime compiled once per target and profile
+        if self.build.stub:
+            if not lookup(key := self.stub_digest()):
+                with TemporaryDirectory(prefix=f"{__package__}-stub-") as empty:
+                    self._cargo(release, environ={
+                        **{k: v for k, v in self.environ.items() if k not in (
+                            "ProductName", "CompanyName", "FileVersion",
+                            "FileDescription", "OriginalFilename")},
+                        "PYAKET_PROJECT": "",
+                        "PYAKET_ASSETS": empty,
+                    })
+                cache.put(key, release, uuid="stub")
+            with self.timings.stage("append") as stage:
+                before = release.stat().st_size
+                self._append(release)
+                stage.bytes = (release.stat().st_size - before)
+
+        # Identical builds yield identical binaries
+        elif self.build.cache and (entry := lookup(key := self.digest())):
+            self.uuid = entry["uuid"]
+
+        else:
+            self._cargo(release, environ=self.environ)
+
+            if self.build.cache:
+                cache.put(key, release, uuid=self.uuid)
+
+        # Release a tarball to keep chmod +x attributes
         if self.build.tarball and self.build.target.is_unix():
-            with tarfile.open(f"{release}.tar.gz", "w:gz") as archive:
-                archive.add(release, arcname=release.name)
+            with self.timings.stage("tarball") as stage:
+                codec   = TarballCodec(PyaketBuild._tarball(self.build.tarball))
+                archive = release.with_name(f"{release.name}.tar.{codec.value}")
+                logger.info(f"Compressing release to {archive.name}")
+                digest  = codec.compress(release, archive, level=self.build.tarball_level)
                 release.unlink()
-            release = Path(archive.name) # type: ignore
+                release = archive
+                stage.bytes = archive.stat().st_size
+        elif self.build.checksum:
+            with self.timings.stage("checksum") as stage:
+                digest = files.sha256(release)
+                stage.bytes = release.stat().st_size
+
+        if self.build.checksum:
+            release.with_name(f"{release.name}.sha256").write_text(f"{digest}  {release.name}\n")
 
         # Ignore all binaries in version control
         self.build.output.joinpath(".gitignore").write_text("*")
 
         return release
 
+    def _cargo(self, release: Path, environ: dict) -> None:
+        """Compile the crate and move the binary to the release path"""
+        with self.timings.stage("cargo") as stage:
+            stage.call((
+                "cargo", *self.build.cargo.build,
+                "--manifest-path", str(pyaket.manifest),
+                "--profile", self.build.profile.value,
+                "--target", self.build.target.value,
+                "--target-dir", str(self.build.target_dir),
+                *(("--timings",) if self.build.cargo_timings else ()),
+            ), env=environ, cwd=pyaket.package)
+
+        # Latest report, cargo also keeps timestamped ones
+        if self.build.cargo_timings:
+            self.timings.cargo_report = (self.build.target_dir/"cargo-timings"/"cargo-timing.html")
+
+        with self.timings.stage("copy") as stage:
+
+            # Find the compiled binary
+            binary = next(
+                (self.build.target_dir/self.build.target.value/self.build.profile.value)
+                .glob(("pyaket" + self.build.target.exe_suffix))
+            )
+            stage.bytes = binary.stat().st_size
+
+            # Rename the compiled binary to the final release name
+            with contextlib.suppress(FileNotFoundError):
+                release.unlink()
+            try:
+                os.replace(binary, release)
+            except OSError:
+                files.clone(binary, release, hardlink=False)
+                binary.unlink()
+            release.chmod(0o755)
+
+        if self.build.upx:
+            with self.timings.stage("upx") as stage:
+                stage.call(("upx", "--best", "--lzma", str(release)))
+                stage.bytes = release.stat().st_size
+
+    def _append(self, release: Path) -> None:
+        """
+        Append the project and staged assets to a prebuilt runtime, read back with
+        mmap by the executable, see `payload.rs` for the layout
+        """
+        assets = dict()
+
+        with release.open("r+b") as file:
+            file.seek(0, os.SEEK_END)
+
+            for path in sorted(self.assets.root.rglob("*")):
+                if not path.is_file():
+                    continue
+                relative = path.relative_to(self.assets.root)
+                assets[relative.as_posix()] = dict(
+                    offset=file.tell(),
+                    size=path.stat().st_size,
+                    sha256=self.assets.sha256(relative),
+                )
+                with path.open("rb") as source:
+                    shutil.copyfileobj(source, file, length=(1024**2))
+
+            index = json.dumps(dict(
+                project=json.loads(self.model_dump_json()),
+                assets=assets,
+            )).encode()
+
+            offset = file.tell()
+            file.write(index)
+            file.write(struct.pack("<QQ", offset, len(index)))
+            file.write(hashlib.sha256(index).digest())
+            file.write(PAYLOAD_MAGIC)
+
+        logger.info(f"Appended payload of {len(assets)} assets to the runtime")
+
+    def matrix(self,
+        targets: Optional[list[Target]]=None,
+        profiles: Optional[list[CargoProfile]]=None,
+        workers: Optional[int]=None,
+    ) -> list[PyaketRelease]:
+        """
+        Compile for many targets and profiles in parallel, sharing the staged assets
+
+        Args:
+            targets: Targets to compile for, defaults to the recommended ones
+            profiles: Profiles to compile with, defaults to the current one
+            workers: Maximum simultaneous builds, defaults to a quarter of the cores
+        """
+        targets  = list(map(Target, targets or Target.recommended()))
+        profiles = list(map(CargoProfile, profiles or (self.build.profile,)))
+        workers  = (workers or max(1, (os.cpu_count() or 1)//4))
+
+        # Assets are the same for all jobs, except per-target standalone environments
+        if not self.standalone:
+            self.stage()
+
+        # Rustup isn't safe to run concurrently
+        rustup = threading.Lock()
+
+        def job(target: Target, profile: CargoProfile) -> PyaketRelease:
+            result = PyaketRelease(target=target, profile=profile)
+
+            # Isolated build options, environment and cargo target shard
+            # - Releases are split by profile only if they would collide
+            project = self.model_copy(update=dict(
+                **(dict(assets=PyaketAssets()) if self.standalone else dict()),
+                environ=self.environ.copy(),
+                timings=PyaketTimings(),
+                build=self.build.model_copy(update=dict(
+                    target=target,
+                    profile=profile,
+                    timings=None,
+                    target_dir=(self.build.target_dir/"matrix"/f"{target.value}-{profile.value}"),
+                    output=(self.build.output/profile.value if len(profiles) > 1 else self.build.output),
+                )),
+            ))
+
+            start = time.perf_counter()
+
+            try:
+                with rustup, project.timings.stage("toolchain"):
+                    project.build.toolchain()
+                if project.standalone:
+                    with project.timings.stage("stage"):
+                        project.stage()
+                result.release = project._compile()
+            except Exception as error:
+                logger.error(f"Failed to compile for {target.value} ({profile.value}): {error}")
+                result.error = f"{type(error).__name__}: {error}"
+
+            result.took = (time.perf_counter() - start)
+            result.timings = project.timings
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                lambda args: job(*args),
+                itertools.product(targets, profiles),
+            ))
+
+        # All jobs in a single document
+        if self.build.timings:
+            self.build.timings.parent.mkdir(parents=True, exist_ok=True)
+            self.build.timings.write_text(json.dumps(
+                [result.model_dump(mode="json") for result in results],
+            indent=2), "utf-8")
+
+        for result in results:
+            if result.release:
+                logger.ok(f"• {result.target.value} ({result.profile.value}) in {result.took:.1f}s: {result.release}")
+            else:
+                logger.error(f"• {result.target.value} ({result.profile.value}) in {result.took:.1f}s: {result.error}")
+
+        return results
+
     # ------------------------------------------------------------------------ #
 
     def from_pyproject(self,
@@ -334,6 +1116,13 @@ class PyaketProject(BaseModel):
         self.entry.module = self.app.name
 
         # Todo: Pin @git+ dependencies
-        # Todo: Load from a lockfile?
         for package in data.get("project", {}).get("dependencies", []):
             self.deps.pypi.append(package)
+
+        # Prefer an existing lockfile, else resolve at build time
+        if pin:
+            self.deps.pin = True
+            for name in ("uv.lock", "pylock.toml"):
+                if (lockfile := path.parent/name).exists():
+                    self.deps.lockfile = lockfile
+                    break
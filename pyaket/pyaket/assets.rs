@@ -1,5 +1,34 @@
 use rust_embed::Embed;
+use rust_embed::EmbeddedFile;
 use anyhow::Result;
+use anyhow::bail;
+use sha2::Digest;
+use sha2::Sha256;
+use std::borrow::Cow;
+use std::path::Path;
+use std::path::PathBuf;
+
+use crate::payload::PAYLOAD;
+
+/// A bundled file, compiled in or borrowed from an appended payload
+pub struct PyaketFile {
+    pub data: Cow<'static, [u8]>,
+    pub sha256: [u8; 32],
+
+    /// Check the data against the hash before extracting, payloads
+    /// aren't covered by the executable's signature
+    pub verify: bool,
+}
+
+impl From<EmbeddedFile> for PyaketFile {
+    fn from(file: EmbeddedFile) -> Self {
+        Self {
+            sha256: file.metadata.sha256_hash(),
+            data: file.data,
+            verify: false,
+        }
+    }
+}
 
 /// All implementations **must** use the following:
 ///
@@ -15,37 +44,140 @@ use anyhow::Result;
 /// ```
 pub trait PyaketEmbed: Embed {
 
+    /// Get a file from the bundle, overridable for other sources
+    fn file(asset: &str) -> Option<PyaketFile> {
+        Self::get(asset).map(PyaketFile::from)
+    }
+
+    /// Relative paths of all files in the bundle
+    fn names() -> Vec<String> {
+        Self::iter().map(|name| name.to_string()).collect()
+    }
+
     /// Check if a file exists in the bundle
     fn exists(asset: &str) -> bool {
-        Self::get(asset).is_some()
+        Self::file(asset).is_some()
     }
 
     /// Read a single known file from the bundle
     fn read(asset: &str) -> Option<Vec<u8>> {
-        Self::get(asset).map(|file| file.data.to_vec())
+        Self::file(asset).map(|file| file.data.to_vec())
+    }
+
+    /// Lazily iterate over files matching a path pattern, data isn't copied
+    /// and borrows the executable's static memory
+    fn stream(pattern: &str) -> Result<impl Iterator<Item=(String, PyaketFile)>> {
+        let engine = glob::Pattern::new(pattern)?;
+        Ok(Self::names().into_iter()
+            .filter(move |file| engine.matches(file))
+            .filter_map(|file| Self::file(&file)
+                .map(|data| (file, data))))
     }
 
     /// Query all files in the bundle matching a path pattern
     fn glob_files(pattern: &str) -> Result<Vec<String>> {
-        let engine = glob::Pattern::new(pattern)?;
-        Ok(Self::iter()
-            .filter(|file| engine.matches(file))
-            .map(|file| file.to_string())
+        Ok(Self::stream(pattern)?
+            .map(|(name, _)| name)
             .collect())
     }
 
     /// Returns the data of an `Self::glob_files()` query
     fn glob_data(pattern: &str) -> Result<Vec<Vec<u8>>> {
-        Ok(Self::glob_files(pattern).unwrap().iter()
-            .map(|file| Self::get(file).unwrap().data.to_vec())
+        Ok(Self::stream(pattern)?
+            .map(|(_, file)| file.data.to_vec())
             .collect())
     }
 
     /// Returns the relative path and data matching a path pattern
+    /// - Warn: Copies all data to memory, prefer `Self::stream()`
     fn glob(pattern: &str) -> Result<Vec<(String, Vec<u8>)>> {
-        let files = Self::glob_files(pattern)?;
-        let data  = Self::glob_data(pattern)?;
-        Ok(files.into_iter().zip(data).collect())
+        Ok(Self::stream(pattern)?
+            .map(|(name, file)| (name, file.data.to_vec()))
+            .collect())
+    }
+
+    /// Extract a file to a content-addressed `store/<sha256>/<name>` path,
+    /// skipped when a previous install or binary already extracted it
+    fn store(asset: &str, store: &Path) -> Result<PathBuf> {
+        let Some(file) = Self::file(asset) else {
+            bail!("Asset not found in bundle: {}", asset)
+        };
+        // Compressed assets are stored decompressed
+        let compressed = asset.ends_with(".zst");
+        let Some(name) = Path::new(asset.trim_end_matches(".zst")).file_name() else {
+            bail!("Asset has no file name: {}", asset)
+        };
+
+        let hash: String = file.sha256
+            .iter().map(|byte| format!("{:02x}", byte)).collect();
+        let path = store.join(hash).join(name);
+
+        if !path.exists() {
+            if file.verify && Sha256::digest(&file.data)[..] != file.sha256 {
+                bail!("Asset checksum mismatch: {}", asset)
+            }
+
+            let parent = path.parent().unwrap();
+            std::fs::create_dir_all(parent)?;
+
+            // Concurrent installs and writers may race, make it atomic
+            let temp = parent.join(format!(".{}.{}.tmp",
+                name.to_string_lossy(), std::process::id()));
+            if compressed {
+                Self::decompress(&file.data, &temp)?;
+            } else {
+                std::fs::write(&temp, &file.data)?;
+            }
+            std::fs::rename(&temp, &path)?;
+        }
+
+        Ok(path)
+    }
+
+    /// Stream decode zstd data to a file, with the bundled `zstd.dict` if any
+    fn decompress(data: &[u8], path: &Path) -> Result<()> {
+        let mut file = std::io::BufWriter::new(std::fs::File::create(path)?);
+
+        match Self::file("zstd.dict") {
+            Some(dict) => {
+                let mut decoder = zstd::stream::read::Decoder::with_dictionary(data, &dict.data)?;
+                std::io::copy(&mut decoder, &mut file)?;
+            }
+            None => {
+                zstd::stream::copy_decode(data, &mut file)?;
+            }
+        }
+
+        std::io::Write::flush(&mut file)?;
+        Ok(())
+    }
+
+    /// Calls `Self::store()` for all files matching a pattern on many threads,
+    /// returns their relative names and stored paths in bundle order
+    fn store_all(pattern: &str, store: &Path, threads: usize) -> Result<Vec<(String, PathBuf)>> {
+        let names = Self::glob_files(pattern)?;
+
+        if names.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        let chunk = names.len().div_ceil(threads.max(1));
+
+        std::thread::scope(|scope| {
+            let workers: Vec<_> = names.chunks(chunk)
+                .map(|names| scope.spawn(move || names.iter()
+                    .map(|name| -> Result<(String, PathBuf)> {
+                        Ok((name.clone(), Self::store(name, store)?))
+                    })
+                    .collect::<Result<Vec<_>>>()))
+                .collect();
+
+            let mut stored = Vec::with_capacity(names.len());
+            for worker in workers {
+                stored.extend(worker.join().unwrap()?);
+            }
+            Ok(stored)
+        })
     }
 }
 
@@ -56,9 +188,34 @@ pub trait PyaketEmbed: Embed {
 #[folder="${PYAKET_ASSETS:-../.cache/assets}"]
 pub struct PyaketAssets;
 
-impl PyaketEmbed for PyaketAssets {}
+impl PyaketEmbed for PyaketAssets {
+
+    /// Appended payloads take precedence over compiled in files
+    fn file(asset: &str) -> Option<PyaketFile> {
+        match PAYLOAD.as_ref() {
+            Some(payload) => payload.file(asset),
+            None => Self::get(asset).map(PyaketFile::from),
+        }
+    }
+
+    fn names() -> Vec<String> {
+        match PAYLOAD.as_ref() {
+            Some(payload) => payload.assets.keys().cloned().collect(),
+            None => Self::iter().map(|name| name.to_string()).collect(),
+        }
+    }
+}
 
 /* -------------------------------------------------------------------------- */
 // Common assets names
 
 pub static ASSET_ICON: &str = "icon";
+
+/// Requirements pinned with hashes at build time, installed without resolution
+pub static ASSET_LOCK: &str = "lock/requirements.txt";
+
+/// Fingerprints of all packages, see `PyaketManifest`
+pub static ASSET_MANIFEST: &str = "manifest.json";
+
+/// Prebuilt interpreter with all packages of standalone releases
+pub static ASSET_STANDALONE: &str = "standalone.tar.zst";
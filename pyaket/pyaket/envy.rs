@@ -30,6 +30,15 @@ pub fn setdefault(name: &str, value: impl Display) {
     }
 }
 
+/// Prepend a directory to the PATH variable
+pub fn prepend_path(path: &std::path::Path) -> anyhow::Result<()> {
+    let current = std::env::var_os("PATH").unwrap_or_default();
+    let paths = std::iter::once(path.to_path_buf())
+        .chain(std::env::split_paths(&current));
+    self::set("PATH", std::env::join_paths(paths)?.to_string_lossy());
+    Ok(())
+}
+
 /* -------------------------------------------------------------------------- */
 // Boolean
 
@@ -20,9 +20,13 @@ pub use anyhow::Result;
 pub mod assets;
 pub mod envy;
 pub mod logging;
+pub mod payload;
 pub mod project;
 pub mod runtime;
 pub mod subproc;
+pub mod trace;
+#[cfg(unix)]
+pub mod zygote;
 pub use assets::*;
 pub use logging::*;
 pub use project::*;
@@ -21,9 +21,16 @@ fn main() -> Result<()> {
 
     LazyLock::force(&START_TIME);
 
-    // Read the project configuration sent from build.rs
-    let project = PyaketProject::from_json(env!("PYAKET_PROJECT"));
-    let runtime = PyaketCLI::try_parse()?.run(&project);
+    // Appended to a prebuilt runtime, or sent from build.rs
+    let compiled;
+    let project = match payload::PAYLOAD.as_ref() {
+        Some(payload) => &payload.project,
+        None => {
+            compiled = PyaketProject::from_json(env!("PYAKET_PROJECT"));
+            &compiled
+        }
+    };
+    let runtime = PyaketCLI::try_parse()?.run(project);
 
     // Hold the terminal open with any Rust or Python errors for convenience
     // - Opt-out with the same variable that enables the feature
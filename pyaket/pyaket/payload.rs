@@ -0,0 +1,112 @@
+//! Project and assets appended to a prebuilt runtime (`build.stub`), read
+//! from the executable's own memory map instead of compiled in
+//!
+//! ```text
+//! [runtime][asset]...[asset][index json][trailer]
+//! ```
+//!
+//! The trailer is the index's absolute offset and length (u64 le), its
+//! sha256 and a magic. The index holds the project and every asset's
+//! absolute offset, size and sha256, assets are verified when stored
+use crate::*;
+use std::borrow::Cow;
+use std::collections::BTreeMap;
+
+use memmap2::Mmap;
+use serde::Deserialize;
+use sha2::Digest;
+use sha2::Sha256;
+
+/// Ends every payload, versioned by the last byte
+pub static PAYLOAD_MAGIC: &[u8; 8] = b"PYAKET\x00\x01";
+
+/// Offset, length, sha256 and magic
+const TRAILER: usize = 8 + 8 + 32 + 8;
+
+#[derive(Deserialize)]
+pub struct PayloadAsset {
+    pub offset: u64,
+    pub size:   u64,
+    pub sha256: String,
+}
+
+#[derive(Deserialize)]
+struct PayloadIndex {
+    project: PyaketProject,
+    assets:  BTreeMap<String, PayloadAsset>,
+}
+
+pub struct Payload {
+    map: Mmap,
+    pub project: PyaketProject,
+    pub assets:  BTreeMap<String, PayloadAsset>,
+}
+
+/// The payload of this executable, none for binaries with compiled in projects
+pub static PAYLOAD: LazyLock<Option<Payload>> = LazyLock::new(|| {
+    match Payload::open(&current_exe().ok()?) {
+        Ok(payload) => payload,
+        Err(error) => {
+            logging::error!("Corrupted payload: {}", error);
+            std::process::exit(1);
+        }
+    }
+});
+
+impl Payload {
+
+    /// Map an executable and parse its trailer, none without the magic or
+    /// when unreadable, only present but invalid payloads are errors
+    pub fn open(path: &Path) -> Result<Option<Self>> {
+        let Ok(file) = std::fs::File::open(path) else {
+            return Ok(None);
+        };
+
+        // Safety: Executables aren't modified while running
+        let Ok(map) = (unsafe {Mmap::map(&file)}) else {
+            return Ok(None);
+        };
+
+        if map.len() < TRAILER || &map[map.len() - 8..] != PAYLOAD_MAGIC {
+            return Ok(None);
+        }
+
+        let trailer = &map[map.len() - TRAILER..];
+        let offset  = u64::from_le_bytes(trailer[0..8].try_into()?) as usize;
+        let length  = u64::from_le_bytes(trailer[8..16].try_into()?) as usize;
+
+        if offset.checked_add(length).is_none_or(|end| end > map.len() - TRAILER) {
+            bail!("Index out of bounds")
+        }
+        let index = &map[offset..offset + length];
+
+        if Sha256::digest(index)[..] != trailer[16..48] {
+            bail!("Index checksum mismatch")
+        }
+
+        let index: PayloadIndex = serde_json::from_slice(index)?;
+
+        for (name, asset) in &index.assets {
+            if asset.offset.checked_add(asset.size).is_none_or(|end| end as usize > offset) {
+                bail!("Asset out of bounds: {}", name)
+            }
+        }
+
+        Ok(Some(Self {map, project: index.project, assets: index.assets}))
+    }
+
+    /// Borrow an asset's data from the executable's memory
+    pub fn file(&'static self, name: &str) -> Option<PyaketFile> {
+        let asset = self.assets.get(name)?;
+        let start = asset.offset as usize;
+        let mut sha256 = [0u8; 32];
+        for (byte, hex) in sha256.iter_mut().zip(asset.sha256.as_bytes().chunks(2)) {
+            *byte = u8::from_str_radix(std::str::from_utf8(hex).ok()?, 16).ok()?;
+        }
+        Some(PyaketFile {
+            data: Cow::Borrowed(&self.map[start..start + asset.size as usize]),
+            sha256,
+            verify: true,
+        })
+    }
+}
@@ -39,6 +39,12 @@ impl PyaketApplication {
 pub struct PyaketDependencies {
     pub pypi: Vec<String>,
     pub rolling: bool,
+
+    #[serde(default)]
+    pub rolling_ttl: u64,
+
+    #[serde(default)]
+    pub rolling_background: bool,
 }
 
 /* -------------------------------------------- */
@@ -56,6 +62,12 @@ pub struct PyaketDirectories {
 #[derive(Serialize, Deserialize)]
 pub struct PyaketPython {
     pub version: String,
+
+    #[serde(default)]
+    pub bytecode: bool,
+
+    #[serde(default)]
+    pub warmup: bool,
 }
 
 impl PyaketPython {
@@ -81,6 +93,50 @@ pub struct PyaketTorch {
 pub struct PyaketEntry {
     pub module:  Option<String>,
     pub command: Option<String>,
+
+    #[serde(default)]
+    pub zygote: bool,
+
+    #[serde(default)]
+    pub preload: Vec<String>,
+
+    #[default(600)]
+    #[serde(default)]
+    pub idle: u64,
+}
+
+/* -------------------------------------------- */
+
+/// Fingerprints of an install's packages, written at build time
+#[derive(Default, PartialEq)]
+#[derive(Serialize, Deserialize)]
+pub struct PyaketManifest {
+    pub python: String,
+    pub torch: String,
+    pub packages: std::collections::BTreeMap<String, String>,
+}
+
+impl PyaketManifest {
+
+    /// Packages to reinstall and uninstall to go from `old` to `self`, or
+    /// none if a fresh environment is needed (python or torch changed)
+    pub fn diff(&self, old: &Self) -> Option<(Vec<String>, Vec<String>)> {
+        if (self.python != old.python) || (self.torch != old.torch) {
+            return None;
+        }
+
+        let changed = self.packages.iter()
+            .filter(|(name, hash)| old.packages.get(*name) != Some(hash))
+            .map(|(name, _)| name.clone())
+            .collect();
+
+        let removed = old.packages.keys()
+            .filter(|name| !self.packages.contains_key(*name))
+            .cloned()
+            .collect();
+
+        Some((changed, removed))
+    }
 }
 
 /* -------------------------------------------- */
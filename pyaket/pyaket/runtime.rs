@@ -1,9 +1,19 @@
 use crate::*;
 use directories::BaseDirs;
-use temp_dir::TempDir;
 
 static WORKSPACE_ROOT: OnceLock<PathBuf> = OnceLock::new();
 
+/// This process's shared `PyaketProject::inuse_lock_file()` lock
+#[cfg(unix)]
+static INUSE: OnceLock<std::fs::File> = OnceLock::new();
+
+/// Flags a detached process upgrading rolling dependencies into a staging copy
+pub static PYAKET_REFRESH: &str = "PYAKET_REFRESH";
+
+/// Seconds between background refreshes when `rolling_ttl` is zero, each
+/// one clones the environment and runs pip, never on every launch
+pub static BACKGROUND_TTL: u64 = 3600;
+
 impl PyaketProject {
 
     /// Centralized working directory for all pyaket files
@@ -33,6 +43,13 @@ impl PyaketProject {
             .join(&self.dirs.common)
     }
 
+    /// Content-addressed store of bundled wheels shared across versions
+    /// and binaries of the same workspace, `$WORKSPACE/Wheels/<sha256>/`
+    pub fn wheel_store(&self) -> PathBuf {
+        self.workspace_common()
+            .join("Wheels")
+    }
+
     /// Where to install the Python's virtual environment:
     /// - `$WORKSPACE/versions/1.0.0`
     pub fn installation_dir(&self) -> PathBuf {
@@ -49,6 +66,121 @@ impl PyaketProject {
         self.installation_dir()
             .join(format!("{}.uuid", self.app.name))
     }
+
+    /// A file whose modification time is the last rolling upgrade
+    pub fn refresh_tracker_file(&self) -> PathBuf {
+        self.installation_dir()
+            .join(format!("{}.refreshed", self.app.name))
+    }
+
+    /// Copy of the installation upgraded by background refreshes, swapped
+    /// in by the next launch when flagged ready
+    pub fn staging_dir(&self) -> PathBuf {
+        PathBuf::from(format!("{}.staging", self.installation_dir().display()))
+    }
+
+    /// Whether a background refresh finished and can be swapped in
+    pub fn staging_ready(&self) -> bool {
+        self.staging_dir().join(format!("{}.ready", self.app.name)).exists()
+    }
+
+    /// Minimum seconds between rolling upgrades, see `BACKGROUND_TTL`
+    pub fn refresh_ttl(&self) -> u64 {
+        match (self.deps.rolling_ttl, self.deps.rolling_background) {
+            (0, true) => BACKGROUND_TTL,
+            (ttl, _)  => ttl,
+        }
+    }
+
+    /// Whether rolling dependencies should be upgraded on this launch
+    pub fn refresh_due(&self) -> bool {
+        if !self.deps.rolling {
+            return false;
+        }
+        let ttl = self.refresh_ttl();
+        if ttl == 0 {
+            return true;
+        }
+        match self.refresh_tracker_file().metadata().and_then(|meta| meta.modified()) {
+            Ok(time) => time.elapsed().map_or(true, |age| age.as_secs() >= ttl),
+            Err(_)   => true,
+        }
+    }
+
+    /// Shared lock held by processes running from an installation, swaps
+    /// wait until nobody holds it, as python imports lazily by path
+    pub fn inuse_lock_file(&self) -> PathBuf {
+        self.installation_dir()
+            .join(format!("{}.inuse", self.app.name))
+    }
+
+    /// Lock file serializing installs of a version across processes, outside
+    /// the installation directory as it may be wiped or renamed
+    pub fn install_lock_file(&self) -> PathBuf {
+        self.workspace_common()
+            .join(&self.dirs.versions)
+            .join(format!("{}.lock", self.app.version))
+    }
+
+    /// A file with the interpreter path of a successful install, allows
+    /// warm launches to call python directly instead of `uv run`
+    pub fn python_tracker_file(&self) -> PathBuf {
+        self.installation_dir()
+            .join(format!("{}.python", self.app.name))
+    }
+
+    /// The packages manifest of the last successful install, to only
+    /// reinstall what changed on the next binary with the same version
+    pub fn manifest_tracker_file(&self) -> PathBuf {
+        self.installation_dir()
+            .join(format!("{}.manifest", self.app.name))
+    }
+
+    /// Packages to reinstall and uninstall against the last install, none
+    /// when there's no compatible environment to update in place
+    pub fn manifest_diff(&self) -> Option<(Vec<String>, Vec<String>)> {
+        if !self.venv_python().exists() {
+            return None;
+        }
+        let new: PyaketManifest = serde_json::from_slice(
+            &PyaketAssets::file(ASSET_MANIFEST)?.data).ok()?;
+        let old: PyaketManifest = serde_json::from_str(
+            &read_string(self.manifest_tracker_file()).ok()?).ok()?;
+        new.diff(&old)
+    }
+
+    /// The most recent successful install of another version, to seed upgrades from.
+    /// Only finished venv installs, never trees being staged, seeded or extracted
+    pub fn previous_installation(&self) -> Option<PathBuf> {
+        std::fs::read_dir(self.installation_dir().parent()?).ok()?
+            .filter_map(|entry| entry.ok())
+            .map(|entry| entry.path())
+            .filter(|path| *path != self.installation_dir())
+            .filter(|path| path.file_name().is_some_and(|name| {
+                let name = name.to_string_lossy();
+                !name.contains(".old.") && ![".staging", ".seeding", ".extracting"]
+                    .iter().any(|suffix| name.ends_with(suffix))
+            }))
+            .filter(|path| path.join(format!("{}.manifest", self.app.name)).is_file())
+            .filter_map(|path| {
+                let tracker = path.join(format!("{}.uuid", self.app.name));
+                let modified = tracker.metadata().ok()?.modified().ok()?;
+                Some((modified, path))
+            })
+            .max_by_key(|(modified, _)| *modified)
+            .map(|(_, path)| path)
+    }
+
+    /// The virtual environment's python interpreter, or the
+    /// standalone interpreter's one when bundled
+    pub fn venv_python(&self) -> PathBuf {
+        match (cfg!(windows), PyaketAssets::exists(ASSET_STANDALONE)) {
+            (true,  false) => self.installation_dir().join("Scripts").join("python.exe"),
+            (false, false) => self.installation_dir().join("bin").join("python"),
+            (true,  true)  => self.installation_dir().join("python.exe"),
+            (false, true)  => self.installation_dir().join("bin").join("python3"),
+        }
+    }
 }
 
 /* -------------------------------------------------------------------------- */
@@ -56,9 +188,24 @@ impl PyaketProject {
 impl PyaketProject {
 
     pub fn run(&self) -> Result<()> {
-        self._export()?;
-        self._install()?;
-        self._entry()?;
+        trace::span("export",  || self._export())?;
+
+        // Detached rolling upgrade spawned by a launch
+        if envy::flag(PYAKET_REFRESH) {
+            return trace::span("refresh", || self._refresh());
+        }
+
+        trace::span("install", || self._install())?;
+
+        // Background refreshes are swapped in only while unused
+        #[cfg(unix)]
+        if self.deps.rolling_background {
+            if let Err(error) = self._inuse() {
+                logging::warn!("Couldn't lock the environment as in use: {}", error);
+            }
+        }
+
+        trace::span("entry",   || self._entry())?;
         Ok(())
     }
 
@@ -69,8 +216,11 @@ impl PyaketProject {
         let executable = current_exe()?.canonicalize()?;
         envy::set("PYAKET", executable.display());
 
-        // Send the project configuration
-        envy::set("PYAKET_PROJECT", env!("PYAKET_PROJECT"));
+        // Send the project configuration, stub runtimes compile in none
+        match payload::PAYLOAD.as_ref() {
+            Some(_) => envy::set("PYAKET_PROJECT", self.json()),
+            None => envy::set("PYAKET_PROJECT", env!("PYAKET_PROJECT")),
+        }
 
         // Load environment variables where the shell is
         for file in glob::glob("*.env")?.map(|x| x.unwrap()) {
@@ -90,86 +240,623 @@ impl PyaketProject {
         Ok(())
     }
 
-    pub fn _install(&self) -> Result<()> {
-        if match read(self.uuid_tracker_file()) {
-            Ok(bytes) => {bytes != self.uuid.as_bytes()},
-            Err(_)    => true,
-        } || self.deps.rolling {
+    /// Hold an exclusive lock for installing this version, released when dropped
+    /// - Operating system locks are released if the process dies, never stale
+    /// - Waits up to `PYAKET_LOCK_TIMEOUT` seconds (default 900) for the holder
+    pub fn _lock(&self) -> Result<std::fs::File> {
+        use std::fs::TryLockError;
+        use std::io::Write;
+        use std::time::Duration;
+
+        let path = self.install_lock_file();
+        mkdir(path.parent().unwrap())?;
+
+        let mut file = std::fs::OpenOptions::new()
+            .create(true).truncate(false)
+            .read(true).write(true)
+            .open(&path)?;
+
+        let timeout = Duration::from_secs_f64(envy::get("PYAKET_LOCK_TIMEOUT")
+            .and_then(|value| value.parse().ok())
+            .unwrap_or(900.0));
+
+        let start = Instant::now();
+        let mut sleep = Duration::from_millis(5);
+
+        loop {
+            match file.try_lock() {
+                Ok(()) => break,
+                Err(TryLockError::WouldBlock) => {
+                    let holder = read_string(&path).unwrap_or_default();
+
+                    if start.elapsed() > timeout {
+                        bail!("Timed out after {:?} waiting for another install of this version \
+                            (pid {}), remove {} if stuck", timeout, holder.trim(), path.display())
+                    }
+                    if sleep == Duration::from_millis(5) {
+                        logging::info!("Waiting for another process installing (pid {})", holder.trim());
+                    }
+
+                    // Short sleeps while it may finish quickly
+                    std::thread::sleep(sleep);
+                    sleep = (sleep * 2).min(Duration::from_millis(200));
+                }
+                Err(TryLockError::Error(error)) => {
+                    return Err(error.into());
+                }
+            }
+        }
+
+        // Record the holder for diagnostics
+        file.set_len(0)?;
+        write!(file, "{}", std::process::id())?;
+        Ok(file)
+    }
+
+    /// Non-blocking `Self::_lock()`, none while another process holds it
+    pub fn _try_lock(&self) -> Result<Option<std::fs::File>> {
+        use std::fs::TryLockError;
 
-            /* Download Python */ {
-                let mut download = subproc::uv()?;
+        let path = self.install_lock_file();
+        mkdir(path.parent().unwrap())?;
 
-                download.arg("python").arg("download")
-                    .arg(&self.python.version);
+        let file = std::fs::OpenOptions::new()
+            .create(true).truncate(false)
+            .read(true).write(true)
+            .open(&path)?;
 
-                subproc::run(&mut download)?;
+        match file.try_lock() {
+            Ok(()) => Ok(Some(file)),
+            Err(TryLockError::WouldBlock) => Ok(None),
+            Err(TryLockError::Error(error)) => Err(error.into()),
+        }
+    }
+
+    /// Hold a shared `Self::inuse_lock_file()` lock for this process's
+    /// lifetime, passed on to the python it execs, see `Self::_entry()`
+    #[cfg(unix)]
+    pub fn _inuse(&self) -> Result<()> {
+        use std::os::unix::fs::MetadataExt;
+        let path = self.inuse_lock_file();
+
+        loop {
+            let file = std::fs::OpenOptions::new()
+                .create(true).truncate(false).write(true)
+                .open(&path)?;
+
+            file.lock_shared()?;
+
+            // A swap replaced the installation while waiting
+            let open = file.metadata()?;
+            if std::fs::metadata(&path).is_ok_and(|meta|
+                (meta.dev(), meta.ino()) == (open.dev(), open.ino()))
+            {
+                let _ = INUSE.set(file);
+                return Ok(());
             }
+        }
+    }
+
+    /// Exclusive `Self::inuse_lock_file()` lock, none while any process
+    /// runs from the installation, new launches wait while it's held
+    pub fn _unused(&self) -> Result<Option<std::fs::File>> {
+        use std::fs::TryLockError;
+
+        let file = std::fs::OpenOptions::new()
+            .create(true).truncate(false).write(true)
+            .open(self.inuse_lock_file())?;
 
-            /* Create the virtual environment */ {
-                let mut setup = subproc::uv()?;
+        match file.try_lock() {
+            Ok(()) => Ok(Some(file)),
+            Err(TryLockError::WouldBlock) => Ok(None),
+            Err(TryLockError::Error(error)) => Err(error.into()),
+        }
+    }
+
+    /// Whether this binary's environment isn't installed yet
+    pub fn outdated(&self) -> bool {
+        match read(self.uuid_tracker_file()) {
+            Ok(bytes) => {bytes != self.uuid.as_bytes()},
+            Err(_)    => true,
+        }
+    }
 
-                setup.arg("venv")
-                    .arg(self.installation_dir())
-                    .arg("--python").arg(&self.python.version)
-                    .arg("--seed")
-                    .arg("--clear")
-                    .arg("--quiet");
-                if self.deps.rolling {setup
-                    .arg("--allow-existing");}
+    pub fn _install(&self) -> Result<()> {
+        let standalone = PyaketAssets::exists(ASSET_STANDALONE);
 
-                subproc::run(&mut setup)?;
+        // Environment upgraded in the background by a previous launch
+        if !standalone && self.staging_ready() {
+            if let Err(error) = trace::span("swap", || self._swap()) {
+                logging::warn!("Couldn't swap the refreshed environment: {}", error);
             }
+        }
+
+        let rolling = !standalone && self.refresh_due();
+
+        // Launch right away, upgrade detached for the next launch
+        if rolling && self.deps.rolling_background && cfg!(unix) && !self.outdated() {
+            return self._background();
+        }
+
+        if !trace::span("check", || self.outdated()) && !rolling {
+            return Ok(());
+        }
 
-            // Todo: Nightly support
-            // Install PyTorch first, as other dependencies might
-            // use a platform's default backend than specified
-            if let Some(version) = &self.torch.version {
-                let mut torch = subproc::uv()?;
+        // Concurrent launches wait for a single installer, then take the
+        // warm path as the environment is ready when they get the lock
+        let _lock = trace::span("lock", || self._lock())?;
 
-                torch.arg("pip").arg("install")
-                    .arg(format!("torch=={}", version))
-                    .arg("torchvision")
-                    .arg("torchaudio")
-                    .arg(format!("--torch-backend={}", self.torch.backend))
-                    .arg("--preview");
+        if !self.outdated() && !rolling {
+            return Ok(());
+        }
+
+        if standalone {
+            trace::span("standalone", || self._standalone())?;
+            self._warmup()?;
+
+        } else {
 
-                subproc::run(&mut torch)?;
+            // Bootstrap stages run concurrently where independent,
+            // first run takes the critical path instead of the sum
+            //
+            //   python ─ venv ─ torch ─┐
+            //   assets ────────────────┴─ pip
+            //
+            // Same python and torch as the last install, update it in place
+            let incremental = self.manifest_diff().is_some();
+
+            let (environment, assets) = std::thread::scope(|scope| {
+                let assets = scope.spawn(|| trace::span("assets", || self._assets()));
+                let environment = match incremental {
+                    false => self._environment(),
+                    true  => Ok(()),
+                };
+                (environment, assets.join().unwrap())
+            });
+            environment?;
+
+            // Also applies to environments seeded from a previous version
+            let diff = self.manifest_diff();
+
+            if let Some((_, removed)) = &diff && !removed.is_empty() {
+                let _span = trace::Span::new("uninstall");
+                let mut uninstall = subproc::uv()?;
+                uninstall.arg("pip").arg("uninstall");
+                uninstall.args(removed);
+                subproc::run(&mut uninstall)?;
             }
 
-            // Must have at least one package
-            let mut command = subproc::uv()?;
-            command.arg("pip").arg("install");
-            command.arg("--upgrade");
+            let mut command = self._pip(&diff, assets?)?;
+            trace::span("pip", || subproc::run(&mut command))?;
+            self._warmup()?;
+        }
+
+        if self.deps.rolling {
+            replace(self.refresh_tracker_file(), "")?;
+        }
+
+        // Flag this was a successful install
+        replace(self.uuid_tracker_file(), &self.uuid)?;
+
+        // Remember the packages for diffing the next install
+        if let Some(manifest) = PyaketAssets::file(ASSET_MANIFEST) {
+            replace(self.manifest_tracker_file(), &manifest.data)?;
+        }
+
+        // Remember the interpreter for direct launches
+        if self.venv_python().exists() {
+            replace(self.python_tracker_file(), self.venv_python().to_string_lossy().as_bytes())?;
+        }
+
+        Ok(())
+    }
+
+    /// The final install command of all packages and bundled files
+    pub fn _pip(&self, diff: &Option<(Vec<String>, Vec<String>)>, assets: Vec<PathBuf>) -> Result<Command> {
+
+        // Must have at least one package
+        let mut command = subproc::uv()?;
+        command.arg("pip").arg("install");
+        command.arg("--upgrade");
+
+        // Pinned dependencies were fully resolved at build time
+        if PyaketAssets::exists(ASSET_LOCK) {
+            let lock = PyaketAssets::store(ASSET_LOCK, &self.wheel_store())?;
+            command.arg("--no-deps");
+            command.arg("-r").arg(lock);
+        } else {
             command.args(&self.deps.pypi);
-            command.arg("pip");
+        }
 
-            // Cleaned when dropped
-            let tempdir = TempDir::with_prefix("pyaket-")?;
-            mkdir(tempdir.child("dist"))?;
+        // Same versions with different wheels or pins aren't upgrades
+        if let Some((changed, _)) = diff {
+            for package in changed {
+                command.arg("--reinstall-package").arg(package);
+            }
+        }
 
-            // Copy and add all installable files
-            for pattern in ["dist/*.whl", "dist/*.tar.gz", "dist/*.txt"] {
-                for (name, bytes) in PyaketAssets::glob(pattern)? {
-                    let file = tempdir.child(&name);
-                    write(&file, bytes)?;
+        command.args(assets);
+        command.arg("pip");
+        Ok(command)
+    }
 
-                    if name.ends_with(".txt") {
-                        command.arg("-r");
-                    }
+    /// Spawn a detached process upgrading rolling dependencies into a staging
+    /// copy of the environment, this launch continues with the current one
+    pub fn _background(&self) -> Result<()> {
+
+        // A refresh or install is running, or one waits to be swapped in
+        let Some(lock) = self._try_lock()? else {
+            return Ok(());
+        };
+        drop(lock);
+
+        if self.staging_ready() {
+            return Ok(());
+        }
 
-                    command.arg(&file);
+        // Debounce launches for the ttl, even if this refresh fails
+        replace(self.refresh_tracker_file(), "")?;
+
+        let mut refresh = Command::new(current_exe()?);
+        refresh.env(PYAKET_REFRESH, "1")
+            .stdin(std::process::Stdio::null())
+            .stdout(std::process::Stdio::null())
+            .stderr(std::process::Stdio::null());
+
+        // Survive the application's terminal signals
+        #[cfg(unix)] {
+            use std::os::unix::process::CommandExt;
+            refresh.process_group(0);
+        }
+
+        refresh.spawn()?;
+        Ok(())
+    }
+
+    /// Upgrade rolling dependencies into `Self::staging_dir()`, flagged ready
+    /// for the next launch to swap in, used by `Self::_background()`
+    #[cfg(unix)]
+    pub fn _refresh(&self) -> Result<()> {
+        let _lock = self._lock()?;
+
+        // Another refresh finished while waiting
+        if self.staging_ready() {
+            return Ok(());
+        }
+
+        let staging = self.staging_dir();
+        let _ = rmdir(&staging);
+
+        link_tree(&self.installation_dir(), &staging,
+            &self.installation_dir().display().to_string(),
+            &staging.display().to_string(),
+        )?;
+
+        // Each tree has its own usage lock
+        let _ = std::fs::remove_file(staging.join(format!("{}.inuse", self.app.name)));
+
+        let mut command = self._pip(&None, self._assets()?)?;
+        command.env("VIRTUAL_ENV", &staging);
+
+        if !command.status()?.success() {
+            let _ = rmdir(&staging);
+            bail!("Background refresh failed: {:?}", command);
+        }
+
+        // Hardlinked trackers, don't write through to the installation. A new
+        // uuid tracker also stops zygotes holding imports of the current one
+        replace(staging.join(format!("{}.refreshed", self.app.name)), "")?;
+        replace(staging.join(format!("{}.uuid", self.app.name)), &self.uuid)?;
+
+        // Ready last, the swap only sees complete environments
+        write(staging.join(format!("{}.ready", self.app.name)), "")?;
+        Ok(())
+    }
+
+    #[cfg(not(unix))]
+    pub fn _refresh(&self) -> Result<()> {
+        bail!("Background refreshes are unix only")
+    }
+
+    /// Replace the installation with a ready background refresh, under the
+    /// install lock, scripts are rewritten to point to the final location.
+    /// Running apps would import upgraded modules from the same paths, the
+    /// swap waits for a launch without any other instance running
+    pub fn _swap(&self) -> Result<()> {
+        let _lock = self._lock()?;
+
+        if !self.staging_ready() {
+            return Ok(());
+        }
+
+        let Some(_inuse) = self._unused()? else {
+            return Ok(());
+        };
+
+        let install = self.installation_dir();
+        let staging = self.staging_dir();
+        let old = PathBuf::from(format!("{}.old.{}", install.display(),
+            std::time::SystemTime::now().duration_since(std::time::UNIX_EPOCH)?.as_nanos()));
+
+        rename(&install, &old)?;
+        if let Err(error) = rename(&staging, &install) {
+            rename(&old, &install)?;
+            return Err(error.into());
+        }
+
+        // Shebangs and activate scripts reference the staging path
+        if let Ok(entries) = std::fs::read_dir(install.join("bin")) {
+            let (from, to) = (staging.display().to_string(), install.display().to_string());
+
+            for entry in entries.filter_map(|entry| entry.ok()) {
+                if let Ok(text) = read_string(entry.path()) && text.contains(&from) {
+                    write(entry.path(), text.replace(&from, &to))?;
                 }
             }
+        }
+
+        let _ = std::fs::remove_file(install.join(format!("{}.ready", self.app.name)));
+        let _ = rmdir(&old);
+        Ok(())
+    }
+
+    /// Download python, create the virtual environment and install torch
+    pub fn _environment(&self) -> Result<()> {
 
-            subproc::run(&mut command)?;
+        /* Download Python */ {
+            let _span = trace::Span::new("python");
+            let mut download = subproc::uv()?;
+
+            download.arg("python").arg("download")
+                .arg(&self.python.version);
+
+            subproc::run(&mut download)?;
+        }
+
+        // New versions start from the previous one's packages
+        let seeded = trace::span("seed", || self._seed())?;
+
+        /* Create the virtual environment */ {
+            let _span = trace::Span::new("venv");
+            let mut setup = subproc::uv()?;
+
+            setup.arg("venv")
+                .arg(self.installation_dir())
+                .arg("--python").arg(&self.python.version)
+                .arg("--seed")
+                .arg("--quiet");
+            if !seeded {setup
+                .arg("--clear");}
+            if seeded || self.deps.rolling {setup
+                .arg("--allow-existing");}
+
+            subproc::run(&mut setup)?;
+        }
+
+        // Todo: Nightly support
+        // Install PyTorch first, as other dependencies might
+        // use a platform's default backend than specified
+        if let Some(version) = &self.torch.version {
+            let _span = trace::Span::new("torch");
+            let mut torch = subproc::uv()?;
+
+            torch.arg("pip").arg("install")
+                .arg(format!("torch=={}", version))
+                .arg("torchvision")
+                .arg("torchaudio")
+                .arg(format!("--torch-backend={}", self.torch.backend))
+                .arg("--preview");
+
+            subproc::run(&mut torch)?;
+        }
+
+        Ok(())
+    }
+
+    /// Optional post-install steps making the first launch as fast as later ones
+    /// - Bytecode: compile all `.pyc` files in parallel across cores
+    /// - Warmup: import the entry module once, populating os and python caches
+    pub fn _warmup(&self) -> Result<()> {
+        if self.python.bytecode {
+            let _span = trace::Span::new("bytecode");
+            let mut compile = Command::new(self.venv_python());
+            compile.arg("-m").arg("compileall")
+                .arg("-q").arg("-j").arg("0")
+                .arg(self.installation_dir());
+            subproc::run(&mut compile)?;
+        }
+
+        if self.python.warmup && let Some(module) = &self.entry.module {
+            let _span = trace::Span::new("warmup");
+            let mut warmup = Command::new(self.venv_python());
+            warmup.arg("-c").arg(format!("import {}", module));
+            subproc::run(&mut warmup)?;
         }
 
-        // Flag this was a successful install
-        write(self.uuid_tracker_file(), &self.uuid)?;
         Ok(())
     }
 
+    /// Extract the prebuilt environment of standalone releases in a single
+    /// stream, no resolution, downloads or subprocesses
+    pub fn _standalone(&self) -> Result<()> {
+        let Some(file) = PyaketAssets::file(ASSET_STANDALONE) else {
+            bail!("Asset not found in bundle: {}", ASSET_STANDALONE)
+        };
+
+        // Extract aside and rename, never leave a partial environment
+        let staging = PathBuf::from(format!("{}.extracting", self.installation_dir().display()));
+        let _ = rmdir(&staging);
+        mkdir(&staging)?;
+
+        let decoder = zstd::stream::read::Decoder::new(&file.data[..])?;
+        let mut archive = tar::Archive::new(decoder);
+        archive.set_preserve_permissions(true);
+
+        for entry in archive.entries()? {
+            let mut entry = entry?;
+
+            // Strip the interpreter's top directory
+            let path: PathBuf = entry.path()?.components().skip(1).collect();
+            if path.as_os_str().is_empty() {
+                continue;
+            }
+
+            let path = staging.join(path);
+            if let Some(parent) = path.parent() {
+                mkdir(parent)?;
+            }
+            entry.unpack(&path)?;
+        }
+
+        let _ = rmdir(self.installation_dir());
+        rename(&staging, self.installation_dir())?;
+        Ok(())
+    }
+
+    /// Clone the latest previous version's environment into a new version's
+    /// installation directory with hardlinks, the following `uv pip install`
+    /// only applies the package differences. Returns whether it was seeded
+    /// - Previous versions are left intact, shared files are never written
+    /// - Unix only, Windows launchers embed absolute paths
+    #[cfg(unix)]
+    pub fn _seed(&self) -> Result<bool> {
+        if !envy::ubool("PYAKET_INCREMENTAL", true)
+            || self.installation_dir().exists()
+            || self.python.is_freethreaded()
+        {
+            return Ok(false);
+        }
+
+        let Some(previous) = self.previous_installation() else {
+            return Ok(false);
+        };
+
+        // Must be the same python minor version
+        let same = read_string(previous.join("pyvenv.cfg")).ok()
+            .and_then(|config| config.lines()
+                .find_map(|line| line.strip_prefix("version_info")
+                    .map(|value| value.trim_start_matches([' ', '=']).trim().to_string())))
+            .is_some_and(|version| (version == self.python.version)
+                || version.starts_with(&format!("{}.", self.python.version)));
+
+        if !same {
+            return Ok(false);
+        }
+
+        logging::info!("Seeding {} from {}", self.installation_dir().display(), previous.display());
+
+        // Build aside and rename, never leave a partial environment
+        let staging = PathBuf::from(format!("{}.seeding", self.installation_dir().display()));
+        let _ = rmdir(&staging);
+
+        let result = link_tree(&previous, &staging,
+            &previous.display().to_string(),
+            &self.installation_dir().display().to_string(),
+        ).and_then(|_| {
+            // Trackers belong to the previous install
+            for tracker in ["uuid", "python", "refreshed", "inuse"] {
+                let _ = std::fs::remove_file(staging.join(format!("{}.{}", self.app.name, tracker)));
+            }
+
+            // Kept to uninstall packages dropped by this version, as an
+            // own copy, writes must never reach the previous install's
+            let manifest = staging.join(format!("{}.manifest", self.app.name));
+            if let Ok(data) = read(&manifest) {
+                replace(&manifest, data)?;
+            }
+
+            Ok(rename(&staging, self.installation_dir())?)
+        });
+
+        if let Err(error) = result {
+            logging::warn!("Seeding failed, installing from scratch: {}", error);
+            let _ = rmdir(&staging);
+            return Ok(false);
+        }
+
+        Ok(true)
+    }
+
+    #[cfg(not(unix))]
+    pub fn _seed(&self) -> Result<bool> {
+        Ok(false)
+    }
+
+    /// Extract all installable files to the store, returns `uv pip install` arguments
+    pub fn _assets(&self) -> Result<Vec<PathBuf>> {
+        let threads = envy::get("PYAKET_EXTRACT_THREADS")
+            .and_then(|value| value.parse().ok())
+            .unwrap_or_else(|| std::thread::available_parallelism()
+                .map(|n| n.get()).unwrap_or(1));
+
+        let mut args = Vec::new();
+
+        // Optionally zstd compressed at build time
+        for pattern in [
+            "dist/*.whl",    "dist/*.whl.zst",
+            "dist/*.tar.gz", "dist/*.tar.gz.zst",
+            "dist/*.txt",    "dist/*.txt.zst",
+        ] {
+            for (name, file) in PyaketAssets::store_all(pattern, &self.wheel_store(), threads)? {
+                if name.trim_end_matches(".zst").ends_with(".txt") {
+                    args.push(PathBuf::from("-r"));
+                }
+                args.push(file);
+            }
+        }
+
+        Ok(args)
+    }
+
     pub fn _entry(&self) -> Result<()> {
+
+        // Fast path: replace this process with the venv's python directly,
+        // skipping a spawn of uv mode and its environment discovery
+        // - Opt-out with PYAKET_FAST=0, falls back if the interpreter is gone
+        // - Standalone environments aren't venvs, always direct
+        if self.entry.command.is_none() && (envy::ubool("PYAKET_FAST", true)
+            || PyaketAssets::exists(ASSET_STANDALONE))
+        {
+            if let Ok(python) = read_string(self.python_tracker_file()) {
+                let python = PathBuf::from(python.trim());
+
+                if python.exists() {
+                    // Same environment as `uv run --active`
+                    if let Some(bin) = python.parent() {
+                        envy::prepend_path(bin)?;
+                    }
+
+                    // Fork from a resident interpreter with warm imports
+                    #[cfg(unix)]
+                    if self.entry.zygote {
+                        match trace::span("zygote", || self._zygote(&python)) {
+                            Ok(Some(code)) => std::process::exit(code),
+                            Ok(None) => {},
+                            Err(error) => {logging::warn!("Zygote launch failed: {}", error);}
+                        }
+                    }
+
+                    let mut main = Command::new(&python);
+
+                    if let Some(module) = &self.entry.module {
+                        main.arg("-m").arg(module);
+                    }
+
+                    main.args(std::env::args().skip(1));
+
+                    // Python runs from the installation in place of this process
+                    #[cfg(unix)]
+                    if let Some(file) = INUSE.get() {
+                        use nix::fcntl::FcntlArg;
+                        use nix::fcntl::FdFlag;
+                        nix::fcntl::fcntl(file, FcntlArg::F_SETFD(FdFlag::empty()))?;
+                    }
+
+                    return subproc::exec(&mut main);
+                }
+            }
+        }
+
         let mut main = subproc::uv()?;
         main.arg("run");
         main.arg("--active");
@@ -193,3 +880,51 @@ impl PyaketProject {
         Ok(())
     }
 }
+
+/* -------------------------------------------------------------------------- */
+
+/// Write a file through a temporary and a rename, a new inode never writes
+/// through hardlinks shared with other installs
+fn replace(path: impl AsRef<Path>, data: impl AsRef<[u8]>) -> Result<()> {
+    let path = path.as_ref();
+    let temp = PathBuf::from(format!("{}.{}.tmp", path.display(), std::process::id()));
+    write(&temp, data)?;
+    rename(&temp, path)?;
+    Ok(())
+}
+
+/// Recreate a directory tree with hardlinks to the source files, scripts in
+/// `bin/` and `pyvenv.cfg` are copied with the `from` path replaced by `to`,
+/// as they embed the environment's location (shebangs, activate)
+#[cfg(unix)]
+fn link_tree(source: &Path, target: &Path, from: &str, to: &str) -> Result<()> {
+    mkdir(target)?;
+
+    for entry in std::fs::read_dir(source)? {
+        let entry = entry?;
+        let kind  = entry.file_type()?;
+        let src   = entry.path();
+        let dst   = target.join(entry.file_name());
+
+        if kind.is_symlink() {
+            std::os::unix::fs::symlink(std::fs::read_link(&src)?, &dst)?;
+
+        } else if kind.is_dir() {
+            link_tree(&src, &dst, from, to)?;
+
+        } else if (entry.file_name() == "pyvenv.cfg")
+            || (source.file_name().is_some_and(|name| name == "bin"))
+        {
+            match read_string(&src) {
+                Ok(text) => write(&dst, text.replace(from, to))?,
+                Err(_)   => {std::fs::copy(&src, &dst)?;},
+            }
+            std::fs::set_permissions(&dst, entry.metadata()?.permissions())?;
+
+        } else if std::fs::hard_link(&src, &dst).is_err() {
+            std::fs::copy(&src, &dst)?;
+        }
+    }
+
+    Ok(())
+}
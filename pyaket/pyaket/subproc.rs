@@ -4,7 +4,12 @@ pub static PYAKET_UV: &str = "PYAKET_UV";
 
 pub fn run(command: &mut Command) -> Result<()> {
     logging::info!("Call ({:?})", command);
-    command.spawn()?.wait()?;
+    let start  = Instant::now();
+    let status = command.spawn()?.wait()?;
+    trace::event("subprocess", start, serde_json::json!({
+        "command": format!("{:?}", command),
+        "code": status.code(),
+    }));
     Ok(())
 }
 
@@ -17,3 +22,20 @@ pub fn uv() -> Result<Command> {
         Ok(Command::new("uv"))
     }
 }
+
+/// Replace the current process with a command, keeping the pid
+#[cfg(unix)]
+pub fn exec(command: &mut Command) -> Result<()> {
+    use std::os::unix::process::CommandExt;
+    trace::event("exec", Instant::now(), serde_json::json!({
+        "command": format!("{:?}", command),
+    }));
+    Err(command.exec().into())
+}
+
+/// Spawn a command and exit with its code, no exec on this platform
+#[cfg(not(unix))]
+pub fn exec(command: &mut Command) -> Result<()> {
+    let status = command.spawn()?.wait()?;
+    std::process::exit(status.code().unwrap_or(1));
+}
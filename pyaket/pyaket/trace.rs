@@ -0,0 +1,66 @@
+//! Opt-in per-phase startup tracing, appends Chrome trace events as JSONL
+//! to the file at `$PYAKET_TRACE`, summarized by `pyaket trace`
+use crate::*;
+use std::io::Write;
+
+use serde_json::Value;
+use serde_json::json;
+
+pub static PYAKET_TRACE: &str = "PYAKET_TRACE";
+
+static TRACE_FILE: LazyLock<Option<PathBuf>> =
+    LazyLock::new(|| envy::get(PYAKET_TRACE).map(PathBuf::from));
+
+/// Whether tracing is enabled
+pub fn enabled() -> bool {
+    TRACE_FILE.is_some()
+}
+
+/// Append a complete event that started at `start` and ends now
+pub fn event(name: &str, start: Instant, args: Value) {
+    let Some(path) = TRACE_FILE.as_ref() else {return};
+
+    let event = json!({
+        "name": name,
+        "cat":  "pyaket",
+        "ph":   "X",
+        "ts":   start.duration_since(*START_TIME).as_micros() as u64,
+        "dur":  start.elapsed().as_micros() as u64,
+        "pid":  std::process::id(),
+        "tid":  0,
+        "args": args,
+    });
+
+    // Tracing must never break the application
+    if let Ok(mut file) = std::fs::OpenOptions::new()
+        .create(true).append(true).open(path)
+    {
+        let _ = writeln!(file, "{}", event);
+    }
+}
+
+/// Measure the duration of a closure as a phase
+pub fn span<T>(name: &str, function: impl FnOnce() -> T) -> T {
+    let start  = Instant::now();
+    let result = function();
+    self::event(name, start, json!({}));
+    result
+}
+
+/// Measures a phase until dropped, for scopes with early returns
+pub struct Span {
+    name:  &'static str,
+    start: Instant,
+}
+
+impl Span {
+    pub fn new(name: &'static str) -> Self {
+        Self {name, start: Instant::now()}
+    }
+}
+
+impl Drop for Span {
+    fn drop(&mut self) {
+        self::event(self.name, self.start, json!({}));
+    }
+}
@@ -0,0 +1,173 @@
+//! Opt-in resident interpreter with preloaded imports, launches are forked
+//! from it instead of paying the import cost, see `resources/zygote.py`
+use crate::*;
+use std::collections::BTreeMap;
+use std::io::IoSlice;
+use std::io::Read;
+use std::io::Write;
+use std::os::fd::AsRawFd;
+use std::os::unix::fs::DirBuilderExt;
+use std::os::unix::fs::MetadataExt;
+use std::os::unix::net::UnixStream;
+
+use nix::sys::signal::SigSet;
+use nix::sys::signal::Signal;
+use nix::sys::socket::ControlMessage;
+use nix::sys::socket::MsgFlags;
+use nix::sys::socket::UnixAddr;
+use nix::unistd::Pid;
+use nix::unistd::getuid;
+
+/// The server script, ran by the environment's python
+static ZYGOTE: &str = include_str!("../resources/zygote.py");
+
+/// Signals relayed to the forked application, which isn't in our group
+const FORWARD: [Signal; 6] = [
+    Signal::SIGINT,
+    Signal::SIGTERM,
+    Signal::SIGHUP,
+    Signal::SIGQUIT,
+    Signal::SIGUSR1,
+    Signal::SIGUSR2,
+];
+
+impl PyaketProject {
+
+    /// Unique per build, new versions and rebuilds never reach old zygotes.
+    /// In a private directory of the user, none if it isn't private
+    pub fn zygote_socket(&self) -> Option<PathBuf> {
+        let uid = getuid().as_raw();
+
+        let directory = match envy::get("XDG_RUNTIME_DIR") {
+            Some(path) => PathBuf::from(path),
+            None => std::env::temp_dir().join(format!("pyaket-{}", uid)),
+        };
+        let _ = std::fs::DirBuilder::new().mode(0o700).create(&directory);
+
+        // Uuids are public, others could squat the path in shared directories
+        let meta = std::fs::symlink_metadata(&directory).ok()?;
+        if !meta.is_dir() || (meta.uid() != uid) || (meta.mode() & 0o077 != 0) {
+            logging::warn!("Zygote directory {} isn't private, skipping", directory.display());
+            return None;
+        }
+
+        Some(directory.join(format!("pyaket-{}.sock", self.uuid)))
+    }
+
+    /// Whether the zygote listening on a socket runs as the current user
+    fn _zygote_trusted(socket: &Path, stream: &UnixStream) -> bool {
+        let uid = getuid().as_raw();
+        let owned = std::fs::symlink_metadata(socket)
+            .is_ok_and(|meta| meta.uid() == uid);
+
+        #[cfg(any(target_os="linux", target_os="android"))]
+        let owned = owned && nix::sys::socket::getsockopt(stream,
+            nix::sys::socket::sockopt::PeerCredentials)
+            .is_ok_and(|credentials| credentials.uid() == uid);
+
+        #[cfg(not(any(target_os="linux", target_os="android")))]
+        let _ = stream;
+
+        owned
+    }
+
+    /// Launch through the zygote, returns the application's exit code, or
+    /// None when unavailable and the caller should launch directly. A new
+    /// zygote is spawned in the background for the next launches
+    pub fn _zygote(&self, python: &Path) -> Result<Option<i32>> {
+        let Some(module) = &self.entry.module else {
+            return Ok(None);
+        };
+
+        let Some(socket) = self.zygote_socket() else {
+            return Ok(None);
+        };
+
+        let Ok(mut stream) = UnixStream::connect(&socket) else {
+            self._zygote_spawn(python, module, &socket)?;
+            return Ok(None);
+        };
+
+        // Never hand our environment and stdio to another user's process
+        if !Self::_zygote_trusted(&socket, &stream) {
+            logging::warn!("Zygote socket {} isn't owned by this user, skipping", socket.display());
+            return Ok(None);
+        }
+
+        let request = serde_json::to_vec(&serde_json::json!({
+            "argv": std::env::args().skip(1).collect::<Vec<String>>(),
+            "cwd":  std::env::current_dir()?,
+            "env":  std::env::vars_os()
+                .filter_map(|(key, value)| Some((key.into_string().ok()?, value.into_string().ok()?)))
+                .collect::<BTreeMap<String, String>>(),
+        }))?;
+
+        // Length and our stdio in a single message, then the request
+        let header = (request.len() as u32).to_be_bytes();
+        let stdio  = [0, 1, 2];
+        let sent = nix::sys::socket::sendmsg::<UnixAddr>(
+            stream.as_raw_fd(),
+            &[IoSlice::new(&header)],
+            &[ControlMessage::ScmRights(&stdio)],
+            MsgFlags::empty(), None,
+        ).is_ok() && stream.write_all(&request).is_ok();
+
+        // Stale zygotes close the connection before forking
+        let mut pid = [0u8; 4];
+        if !sent || stream.read_exact(&mut pid).is_err() {
+            self._zygote_spawn(python, module, &socket)?;
+            return Ok(None);
+        }
+        let pid = Pid::from_raw(i32::from_be_bytes(pid));
+
+        // Blocked signals are inherited by the relay thread, which waits on them
+        let mut signals = SigSet::empty();
+        FORWARD.iter().for_each(|signal| signals.add(*signal));
+
+        if signals.thread_block().is_ok() {
+            std::thread::spawn(move || loop {
+                if let Ok(signal) = signals.wait() {
+                    let _ = nix::sys::signal::kill(pid, signal);
+                }
+            });
+        }
+
+        // No code means the application crashed without unwinding
+        let mut code = [0u8; 4];
+        match stream.read_exact(&mut code) {
+            Ok(()) => Ok(Some(i32::from_be_bytes(code))),
+            Err(_) => Ok(Some(1)),
+        }
+    }
+
+    /// Start a detached zygote, imports happen in the background. Skipped
+    /// while another zygote holds the lock, either importing or listening
+    fn _zygote_spawn(&self, python: &Path, module: &str, socket: &Path) -> Result<()> {
+        use std::fs::TryLockError;
+        use std::os::unix::fs::OpenOptionsExt;
+
+        let lock = std::fs::OpenOptions::new()
+            .create(true).truncate(false)
+            .read(true).write(true).mode(0o600)
+            .open(socket.with_extension("lock"))?;
+
+        match lock.try_lock() {
+            Ok(()) => drop(lock),
+            Err(TryLockError::WouldBlock) => return Ok(()),
+            Err(TryLockError::Error(error)) => return Err(error.into()),
+        }
+
+        let mut server = Command::new(python);
+        server.arg("-c").arg(ZYGOTE)
+            .arg(socket)
+            .arg(self.uuid_tracker_file())
+            .arg(self.entry.idle.to_string())
+            .arg(module)
+            .args(&self.entry.preload)
+            .stdin(std::process::Stdio::null())
+            .stdout(std::process::Stdio::null())
+            .stderr(std::process::Stdio::null());
+        server.spawn()?;
+        Ok(())
+    }
+}
@@ -0,0 +1,171 @@
+"""
+Resident interpreter forking module launches with preloaded imports
+
+Started detached by executables with `entry.zygote`, as `python -c (this) socket
+watch idle module (preload...)`. Each connection sends a 4 byte length and the
+client's stdio descriptors (SCM_RIGHTS), then a json of argv, env and cwd. A
+forked child takes over the descriptors, replies its pid, runs the module as
+__main__ and replies its 4 byte exit code before exiting.
+
+Exits after `idle` seconds without launches or when the `watch` file changes
+(new install or swapped refresh of this version), clients then fall back to a
+direct launch.
+
+A zygote holds an exclusive lock on the socket's `.lock` sibling from before
+its imports until it exits, only one starts or listens at a time and clients
+don't spawn others meanwhile.
+"""
+import contextlib
+import fcntl
+import importlib
+import json
+import os
+import random
+import runpy
+import signal
+import socket
+import struct
+import sys
+import traceback
+
+
+def receive(connection: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        if not (chunk := connection.recv(size - len(data))):
+            raise ConnectionError("Client disconnected")
+        data += chunk
+    return data
+
+def stamp(path: str) -> tuple[int, int]:
+    try:
+        stat = os.stat(path)
+        return (stat.st_ino, stat.st_mtime_ns)
+    except OSError:
+        return (0, 0)
+
+def child(connection: socket.socket, header: bytes, fds: list[int], module: str) -> int:
+    header += receive(connection, 4 - len(header))
+    (length,) = struct.unpack(">I", header)
+    request = json.loads(receive(connection, length))
+
+    # Become the client's process for the application
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    sys.stdin  = sys.__stdin__  = open(0, "r", closefd=False)
+    sys.stdout = sys.__stdout__ = open(1, "w", closefd=False, buffering=(1 if os.isatty(1) else -1))
+    sys.stderr = sys.__stderr__ = open(2, "w", closefd=False, buffering=1)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+    random.seed()
+
+    connection.sendall(struct.pack(">i", os.getpid()))
+    sys.argv = [module, *request["argv"]]
+
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+        return 0
+    except SystemExit as exit:
+        if (exit.code is None) or isinstance(exit.code, int):
+            return (exit.code or 0)
+        print(exit.code, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+def main(path: str, watch: str, idle: int, module: str, *preload: str) -> None:
+
+    # Detach from the launcher's terminal, unless already a group leader
+    with contextlib.suppress(OSError):
+        os.setsid()
+
+    # Another zygote is importing or listening
+    lock = os.open(os.path.splitext(path)[0] + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(lock)
+        return
+
+    # Never replace a live listener's socket
+    with socket.socket(socket.AF_UNIX) as probe:
+        try:
+            probe.connect(path)
+            os.close(lock)
+            return
+        except OSError:
+            pass
+
+    for name in (preload or (module,)):
+        importlib.import_module(name)
+
+    if os.path.exists(path):
+        os.unlink(path)
+
+    old = os.umask(0o077)
+    server = socket.socket(socket.AF_UNIX)
+    server.bind(path)
+    server.listen(64)
+    server.settimeout(idle or None)
+    inode = os.stat(path).st_ino
+    os.umask(old)
+
+    # Children are never waited on, the clients get their exit codes
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    modified = stamp(watch)
+
+    try:
+        while True:
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                break
+            except InterruptedError:
+                continue
+
+            # Reinstalled environment, preloaded modules are stale
+            if stamp(watch) != modified:
+                connection.close()
+                break
+
+            try:
+                header, fds, _, _ = socket.recv_fds(connection, 4, 3)
+            except OSError:
+                connection.close()
+                continue
+
+            if os.fork() == 0:
+                server.close()
+                os.close(lock)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                code = 1
+                try:
+                    code = child(connection, header, fds, module)
+                finally:
+                    try:
+                        sys.stdout.flush()
+                        sys.stderr.flush()
+                        connection.sendall(struct.pack(">i", code))
+                    finally:
+                        os._exit(code & 0xFF)
+
+            for fd in fds:
+                os.close(fd)
+            connection.close()
+    finally:
+        # Don't remove a newer zygote's socket
+        if stamp(path)[0] == inode:
+            os.unlink(path)
+        server.close()
+        os.close(lock)
+
+if __name__ == "__main__":
+    main(sys.argv[1], sys.argv[2], int(sys.argv[3]), *sys.argv[4:])
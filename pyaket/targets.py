@@ -1,7 +1,8 @@
 """Last sync: Rust 1.97.0-nightly (2026-4-22)"""
+import functools
+import hashlib
 import json
 import os
-import subprocess
 from enum import Enum
 from pathlib import Path
 from typing import Iterable, Optional, Self
@@ -9,8 +10,49 @@ from typing import Iterable, Optional, Self
 specs_json: Path = (Path(__file__).parent.joinpath("resources", "targets.json"))
 """Json file path with all rust target specs"""
 
-specs: dict = json.loads(specs_json.read_text(encoding="utf-8"))
-"""Dictionary from `rustc -Z unstable-options --print all-target-specs-json`"""
+index_json: Path = (Path(__file__).parent.joinpath("resources", "targets.index.json"))
+"""Compact table of the commonly used fields of all target specs"""
+
+INDEX_FIELDS: tuple[str, ...] = ("os", "arch", "exe-suffix", "description", "tier", "std", "host_tools")
+"""Spec (or spec metadata) fields stored in the compact index"""
+
+@functools.cache
+def load_specs() -> dict:
+    """Dictionary from `rustc -Z unstable-options --print all-target-specs-json`"""
+    return json.loads(specs_json.read_text(encoding="utf-8"))
+
+def specs_digest() -> str:
+    """Sha256 of the specs file, any edit invalidates the index"""
+    return hashlib.sha256(specs_json.read_bytes()).hexdigest()
+
+def make_index(specs: dict) -> dict:
+    """Per-target rows of `INDEX_FIELDS`, keyed by the specs file hash for staleness"""
+    return dict(
+        source=specs_digest(),
+        fields=INDEX_FIELDS,
+        targets={name: [
+            spec.get(field, spec.get("metadata", {}).get(field))
+            for field in INDEX_FIELDS
+        ] for (name, spec) in specs.items()},
+    )
+
+@functools.cache
+def load_index() -> dict[str, dict]:
+    """Commonly used fields of every target, without parsing all specs"""
+    try:
+        index = json.loads(index_json.read_text(encoding="utf-8"))
+        if (index["source"] != specs_digest()):
+            raise ValueError("Outdated index")
+    except (FileNotFoundError, ValueError, KeyError):
+        index = make_index(load_specs())
+
+    return {name: dict(zip(index["fields"], row))
+        for (name, row) in index["targets"].items()}
+
+def __getattr__(name: str):
+    if (name == "specs"):
+        return load_specs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Target(str, Enum):
     """
@@ -27,10 +69,8 @@ class Target(str, Enum):
         """Get the current host triple"""
         if (value := os.getenv("PYAKET_HOST_TRIPLE")):
             return cls(value)
-        return cls(subprocess.run(
-            ("rustc", "--print", "host-tuple"),
-            capture_output=True, text=True
-        ).stdout.strip())
+        from pyaket import toolchain
+        return cls(toolchain.host())
 
     # -------------------------------- #
     # Specifications
@@ -38,50 +78,55 @@ class Target(str, Enum):
     @property
     def spec(self) -> dict:
         """Same as `rustc --print target-spec-json --target <this>`"""
-        return specs[self.value]
+        return load_specs()[self.value]
 
     @property
     def metadata(self) -> dict:
         return self.spec["metadata"]
 
+    @property
+    def index(self) -> dict:
+        """Commonly used spec fields, cheaper than `spec`"""
+        return load_index()[self.value]
+
     @property
     def description(self) -> str:
         """Human-readable description of this target"""
-        return self.metadata["description"]
+        return self.index["description"]
 
     @property
     def tier(self) -> int:
         """Support tier level for this target"""
-        return self.metadata["tier"]
+        return self.index["tier"]
 
     @property
     def stdlib(self) -> bool:
         """Does this target have rust stdlib available?"""
-        return bool(self.metadata["std"])
+        return bool(self.index["std"])
 
     @property
     def host_tools(self) -> bool:
         """Does this target support compiling rust?"""
-        return bool(self.metadata["host_tools"])
+        return bool(self.index["host_tools"])
 
     @property
     def exe_suffix(self) -> str:
-        return self.spec.get("exe-suffix", "")
+        return (self.index["exe-suffix"] or "")
 
     # -------------------------------- #
     # Operating Systems
 
     def is_windows(self) -> bool:
-        return (self.spec["os"] == "windows")
+        return (self.index["os"] == "windows")
 
     def is_linux(self) -> bool:
-        return (self.spec["os"] == "linux")
+        return (self.index["os"] == "linux")
 
     def is_macos(self) -> bool:
-        return (self.spec["os"] == "macos")
+        return (self.index["os"] == "macos")
 
     def is_bsd(self) -> bool:
-        return self.spec["os"] in ("freebsd", "netbsd", "openbsd")
+        return self.index["os"] in ("freebsd", "netbsd", "openbsd")
 
     def is_unix(self) -> bool:
         return any((
@@ -96,13 +141,13 @@ class Target(str, Enum):
     # Intel x86
 
     def is_x86_32(self) -> bool:
-        return (self.spec["arch"] == "x86")
+        return (self.index["arch"] == "x86")
 
     def is_x86_64(self) -> bool:
-        return (self.spec["arch"] == "x86_64")
+        return (self.index["arch"] == "x86_64")
 
     def is_x86(self) -> bool:
-        return self.spec["arch"].startswith("x86")
+        return self.index["arch"].startswith("x86")
 
     # ARM
 
@@ -516,6 +561,10 @@ if __name__ == "__main__":
         "--print", "all-target-specs-json",
         "-o", str(specs_json),
     ))
+    load_specs.cache_clear()
+
+    # Compact index for quick lookups
+    index_json.write_text(json.dumps(make_index(load_specs()), separators=(",", ":")))
 
     # Generate and print enum entries
     targets: dict = json.loads(specs_json.read_text())
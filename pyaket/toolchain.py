@@ -0,0 +1,119 @@
+"""On-disk cache of rustc and rustup probes, subprocesses are slow"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+def cache_dir() -> Path:
+    """Platform's user cache directory for pyaket, or `$PYAKET_CACHE`"""
+    if (path := os.getenv("PYAKET_CACHE")):
+        return Path(path)
+    if (sys.platform == "win32"):
+        return Path(os.getenv("LOCALAPPDATA", "~")).expanduser()/"pyaket"
+    if (sys.platform == "darwin"):
+        return Path("~/Library/Caches/pyaket").expanduser()
+    return Path(os.getenv("XDG_CACHE_HOME") or "~/.cache").expanduser()/"pyaket"
+
+cache_file: Path = (cache_dir()/"toolchain.json")
+"""File storing the probed toolchain state"""
+
+_state: Optional[dict] = None
+
+def fingerprint() -> str:
+    """Paths and modification times of rustc, rustup and rustup's settings"""
+    rustup_home = Path(os.getenv("RUSTUP_HOME") or Path.home()/".rustup")
+    sha = hashlib.sha256()
+    for path in (
+        shutil.which("rustc"),
+        shutil.which("rustup"),
+        (rustup_home/"settings.toml"),
+    ):
+        if path and (path := Path(path)).exists():
+            sha.update(f"{path}:{path.stat().st_mtime_ns}".encode())
+        else:
+            sha.update(f"{path}:missing".encode())
+    return sha.hexdigest()
+
+def load() -> dict:
+    """Cached probes, empty when the toolchain changed"""
+    global _state
+
+    if (_state is None):
+        try:
+            _state = json.loads(cache_file.read_text("utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            _state = dict()
+
+    if (_state.get("fingerprint") != (key := fingerprint())):
+        _state = dict(fingerprint=key)
+
+    return _state
+
+def save() -> None:
+    if (_state is None):
+        return
+    _state["fingerprint"] = fingerprint()
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    temp.write_text(json.dumps(_state, indent=2), "utf-8")
+    os.replace(temp, cache_file)
+
+def invalidate() -> None:
+    """Forget all cached probes, next builds query rustc and rustup again"""
+    global _state
+    _state = None
+    cache_file.unlink(missing_ok=True)
+
+# ---------------------------------------------------------------------------- #
+
+def host() -> str:
+    """Cached `rustc --print host-tuple`"""
+    if not (state := load()).get("host"):
+        state["host"] = subprocess.run(
+            ("rustc", "--print", "host-tuple"),
+            capture_output=True, text=True
+        ).stdout.strip()
+        save()
+    return state["host"]
+
+def installed() -> list[str]:
+    """Cached `rustup target list --installed`"""
+    if (targets := (state := load()).get("targets")) is None:
+        targets = state["targets"] = subprocess.run(
+            ("rustup", "target", "list", "--installed"),
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        save()
+    return targets
+
+def ensure(target: str) -> None:
+    """Install the stable toolchain and a target's stdlib, only if needed"""
+    if not (state := load()).get("configured"):
+        subprocess.check_call(("rustup", "set", "profile", "minimal"))
+        subprocess.check_call(("rustup", "default", "stable"))
+        state["configured"] = True
+        save()
+
+    if (target not in installed()):
+        subprocess.check_call(("rustup", "target", "add", target))
+        installed().append(target)
+        save()
+
+# ---------------------------------------------------------------------------- #
+
+def main(refresh: bool=False) -> None:
+    """
+    Show the cached rust toolchain probes
+
+    Args:
+        refresh: Invalidate the cache and probe again
+    """
+    if refresh:
+        invalidate()
+    print(f"Host:    {host()}")
+    print(f"Targets: {', '.join(installed())}")
+    print(f"Cache:   {cache_file}")
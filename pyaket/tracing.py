@@ -0,0 +1,73 @@
+"""Summarize runtime traces written by executables with `PYAKET_TRACE=path`"""
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+
+def events(path: Path) -> Iterable[dict]:
+    """Complete events of a trace file, either JSONL or a Chrome trace JSON"""
+    text = Path(path).read_text("utf-8").strip()
+
+    if text.startswith(("[", "{\"traceEvents\"")):
+        data = json.loads(text)
+        items = (data["traceEvents"] if isinstance(data, dict) else data)
+    else:
+        items = (json.loads(line) for line in text.splitlines() if line.strip())
+
+    for event in items:
+        if (event.get("ph") == "X"):
+            yield event
+
+def percentile(values: list[float], percent: float) -> float:
+    """Linearly interpolated percentile of sorted values"""
+    if not values:
+        return 0.0
+    index = (len(values) - 1) * (percent / 100)
+    lower = int(index)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (index - lower)
+
+def summarize(paths: Iterable[Path]) -> dict[str, dict]:
+    """Per phase count and duration statistics in milliseconds over many traces"""
+    phases: dict[str, list[float]] = dict()
+
+    for path in paths:
+        for event in events(path):
+            phases.setdefault(event["name"], []).append(event["dur"] / 1000)
+
+    summary = dict()
+    for name, durations in phases.items():
+        durations.sort()
+        summary[name] = dict(
+            count=len(durations),
+            mean=sum(durations) / len(durations),
+            p50=percentile(durations, 50),
+            p90=percentile(durations, 90),
+            p99=percentile(durations, 99),
+            max=durations[-1],
+        )
+    return summary
+
+def main(*paths: Path, json_output: bool=False) -> None:
+    """
+    Summarize per-phase durations of many runtime trace files
+
+    Args:
+        paths: Trace files written by executables run with `PYAKET_TRACE=path`
+        json_output: Print the summary as json instead of a table
+    """
+    summary = summarize(paths)
+
+    if json_output:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print("| Phase      | Count | Mean      | P50       | P90       | P99       | Max       |")
+    print("| :--------- | ----: | --------: | --------: | --------: | --------: | --------: |")
+    for name, stats in summary.items():
+        print((
+            f"| {name.ljust(10)} "
+            f"| {stats['count']:5d} "
+            + "".join(f"| {stats[key]:6.1f} ms " for key in ("mean", "p50", "p90", "p99", "max"))
+            + "|"
+        ))
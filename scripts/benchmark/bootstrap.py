@@ -0,0 +1,205 @@
+"""
+Measure what users feel: first-run bootstrap and warm starts with real dependencies
+
+Wheels: `pip attrs rich pydantic numpy pillow`, see `wheelhouse.py` for the setup.
+For every profile and sample app, measures:
+- Cold: first run on a fresh workspace and empty uv cache
+- Warm: second run, the environment exists (hyperfine)
+- Reinstall: run after a rebuild (new uuid) on an existing workspace and warm uv cache
+- First: the first launch importing the app's packages after a cold install
+
+Every app is measured in each mode:
+- resolve: dependencies are resolved at runtime
+- pinned: resolved at build time, installed without resolution
+- standalone: the whole environment is prebuilt, extracted in a single stream
+- bytecode: resolve, with bytecode precompiled at install
+
+Apps with requirements missing from the wheelhouse are skipped
+"""
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator, Self
+
+from attrs import Factory, define
+from pyaket import CargoProfile, PyaketProject
+from wheelhouse import Suite, distribution, hyperfine, main, normalize, offline, stats
+
+
+@define
+class App:
+    name: str
+    pypi: tuple[str, ...] = tuple()
+    imports: tuple[str, ...] = tuple()
+
+    def available(self, wheelhouse: Path) -> bool:
+        names = set(map(distribution, (*wheelhouse.glob("*.whl"), *wheelhouse.glob("*.tar.gz"))))
+        return all(normalize(re.split(r"[<>=!~\[; ]", x)[0]) in names for x in self.pypi)
+
+APPS: tuple[App, ...] = (
+    App(name="empty"),
+    App(name="small",  pypi=("attrs",), imports=("attrs",)),
+    App(name="medium", pypi=("rich", "pydantic"), imports=("rich.console", "pydantic")),
+    App(name="large",  pypi=("numpy", "pillow", "rich", "pydantic"), imports=("numpy", "PIL.Image", "rich.console", "pydantic")),
+)
+
+# Pairs of (mode, bytecode)
+VARIANTS: tuple[tuple[str, bool], ...] = (
+    ("resolve",    False),
+    ("pinned",     False),
+    ("standalone", False),
+    ("resolve",    True),
+)
+
+@define
+class Bootstrap:
+    app: App
+    profile: CargoProfile
+    index: str
+    mode: str = "resolve"
+    bytecode: bool = False
+    runs: int = 5
+
+    size: float = 0.0
+    cold: dict = Factory(dict)
+    warm: dict = Factory(dict)
+    reinstall: dict = Factory(dict)
+    first: dict = Factory(dict)
+
+    @property
+    def variant(self) -> str:
+        return self.mode + ("+bytecode" if self.bytecode else "")
+
+    def run(self) -> Self:
+        project = PyaketProject()
+        project.app.name = f"bootstrap-{self.app.name}"
+        project.deps.pypi = list(self.app.pypi)
+        project.deps.pin = (self.mode == "pinned")
+        project.build.standalone = (self.mode == "standalone")
+        project.python.bytecode = self.bytecode
+        project.build.profile = self.profile
+        release = project.compile()
+        self.size = release.stat().st_size / (1000 * 1000)
+
+        # Never reach the network, python is already installed
+        environ = offline(self.index)
+
+        def execute(env: dict, code: str="") -> float:
+            start = time.perf_counter()
+            subprocess.run((str(release), "-c", code),
+                env=(os.environ | environ | env),
+                stdout=subprocess.DEVNULL,
+                check=True,
+            )
+            return time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory(prefix="pyaket-bootstrap-") as temp:
+            cold, first = list(), list()
+            imports = "; ".join(f"import {module}" for module in self.app.imports)
+
+            for run in range(self.runs):
+                workspace = Path(temp)/f"workspace-{run}"
+                cache = Path(temp)/f"cache-{run}"
+                env = dict(WORKSPACE=str(workspace), UV_CACHE_DIR=str(cache))
+                cold.append(execute(env))
+                first.append(execute(env, code=imports))
+                shutil.rmtree(workspace)
+                shutil.rmtree(cache)
+
+            self.cold = stats(cold)
+            self.first = stats(first)
+
+            # Keep one installed workspace with a warm uv cache
+            env = dict(WORKSPACE=str(Path(temp)/"workspace"), UV_CACHE_DIR=str(Path(temp)/"cache"))
+            execute(env)
+
+            self.warm = hyperfine(release, "-c", "",
+                warmup=5, runs=(self.runs * 10),
+                env=(environ | env),
+            )["results"][0]
+
+            # A rebuilt binary has a new uuid, same as invalidating the tracker
+            tracker = (Path(env["WORKSPACE"])
+                /project.dirs.common/project.dirs.versions
+                /project.app.version/f"{project.app.name}.uuid")
+
+            reinstall = list()
+
+            for _ in range(self.runs):
+                tracker.write_text("rebuilt")
+                reinstall.append(execute(env))
+
+            self.reinstall = stats(reinstall)
+
+        return self
+
+    def metrics(self) -> dict:
+        """Flat metrics for the history, lower is better"""
+        name = f"{self.profile.value}.{self.app.name}" + ("" if (self.variant == "resolve") else f".{self.variant}")
+        return {
+            f"{name}.size":      self.size,
+            f"{name}.cold":      self.cold["times"],
+            f"{name}.warm":      self.warm["times"],
+            f"{name}.reinstall": self.reinstall["times"],
+            f"{name}.first":     self.first["times"],
+        }
+
+    def results(self) -> dict:
+        return dict(
+            app=self.app.name,
+            mode=self.mode,
+            bytecode=self.bytecode,
+            pypi=list(self.app.pypi),
+            profile=self.profile.value,
+            size=self.size,
+            cold=self.cold,
+            warm=self.warm,
+            reinstall=self.reinstall,
+            first=self.first,
+        )
+
+@define
+class Bootstraps(Suite):
+    columns = (
+        ("Profile",   8,  "<"),
+        ("App",       8,  "<"),
+        ("Variant",   18, "<"),
+        ("Size",      9,  ">"),
+        ("Cold",      9,  ">"),
+        ("First",     9,  ">"),
+        ("Warm",      8,  ">"),
+        ("Reinstall", 9,  ">"),
+    )
+
+    def sweep(self, index: str) -> Iterator[Bootstrap]:
+
+        # Build time resolution uses the same index
+        os.environ["UV_DEFAULT_INDEX"] = index
+
+        for profile in CargoProfile:
+            for app in APPS:
+                if not app.available(self.wheelhouse):
+                    print(f"Skipping app {app.name}, missing wheels for {app.pypi}")
+                    continue
+                for mode, bytecode in VARIANTS:
+                    yield Bootstrap(app=app, profile=profile,
+                        index=index, mode=mode, bytecode=bytecode).run()
+
+    def row(self, sample: Bootstrap) -> tuple[str, ...]:
+        return (
+            sample.profile.value,
+            sample.app.name,
+            sample.variant,
+            f"{sample.size:6.2f} MB",
+            f"{sample.cold['mean']:7.2f} s",
+            f"{sample.first['mean']:7.2f} s",
+            f"{sample.warm['mean']*1000:5.1f} ms",
+            f"{sample.reinstall['mean']:7.2f} s",
+        )
+
+if __name__ == "__main__":
+    main(Bootstraps, "bootstrap")
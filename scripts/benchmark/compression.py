@@ -0,0 +1,95 @@
+"""
+Binary size versus first-run time of zstd compressed assets, per compression level
+
+Wheels: `pip numpy pillow`, see `wheelhouse.py` for the setup. All wheels of the
+directory are bundled. First runs use a fresh workspace and a warm uv cache,
+isolating extraction from downloads
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Self
+
+from attrs import Factory, define
+from pyaket import PyaketProject
+from wheelhouse import Suite, main, offline, stats
+
+LEVELS: tuple[Optional[int], ...] = (None, 1, 3, 9, 19)
+
+@define
+class Compression:
+    wheelhouse: Path
+    index: str
+    level: Optional[int] = None
+    runs: int = 5
+
+    size: float = 0.0
+    first: dict = Factory(dict)
+
+    @property
+    def name(self) -> str:
+        return ("raw" if (self.level is None) else f"zstd-{self.level}")
+
+    def run(self) -> Self:
+        project = PyaketProject()
+        project.app.name = f"compression-{self.name}"
+        project.deps.wheels = [self.wheelhouse]
+        project.build.zstd = self.level
+        release = project.compile()
+        self.size = release.stat().st_size / (1000 * 1000)
+
+        with tempfile.TemporaryDirectory(prefix="pyaket-compression-") as temp:
+            environ = os.environ | offline(self.index) | dict(
+                UV_CACHE_DIR=str(Path(temp)/"cache"),
+            )
+            times = list()
+
+            # First run warms the uv cache only
+            for run in range(self.runs + 1):
+                workspace = Path(temp)/f"workspace-{run}"
+                start = time.perf_counter()
+                subprocess.run((str(release), "-c", ""),
+                    env=(environ | dict(WORKSPACE=str(workspace))),
+                    stdout=subprocess.DEVNULL,
+                    check=True,
+                )
+                times.append(time.perf_counter() - start)
+                shutil.rmtree(workspace)
+
+            self.first = stats(times[1:])
+
+        return self
+
+    def metrics(self) -> dict:
+        return {
+            f"{self.name}.size":  self.size,
+            f"{self.name}.first": self.first["times"],
+        }
+
+    def results(self) -> dict:
+        return dict(assets=self.name, level=self.level, size=self.size, first=self.first)
+
+@define
+class Compressions(Suite):
+    columns = (
+        ("Assets",    8, "<"),
+        ("Size",      9, ">"),
+        ("First run", 9, ">"),
+    )
+
+    def sweep(self, index: str) -> Iterator[Compression]:
+        for level in LEVELS:
+            yield Compression(self.wheelhouse, index, level).run()
+
+    def row(self, sample: Compression) -> tuple[str, ...]:
+        return (
+            sample.name,
+            f"{sample.size:6.2f} MB",
+            f"{sample.first['mean']:7.2f} s",
+        )
+
+if __name__ == "__main__":
+    main(Compressions, "compression")
@@ -0,0 +1,66 @@
+"""
+Launch many processes of the same binary at once on a fresh workspace
+
+Only one of them must install, the others wait on the install lock and start
+from the ready environment. Exits with an error if any launch failed or more
+than one process installed, measured with `PYAKET_TRACE` phases
+
+- `python contention.py [processes=32] [binary]`
+
+Without a binary, builds a default project for the host
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pyaket import PyaketProject
+from pyaket.tracing import events
+
+# Phases only an installer goes through
+INSTALL: set[str] = {"venv", "standalone", "pip"}
+
+if __name__ == "__main__":
+    processes = int(sys.argv[1]) if (len(sys.argv) > 1) else 32
+
+    if len(sys.argv) > 2:
+        binary = Path(sys.argv[2])
+    else:
+        project = PyaketProject()
+        project.app.name = "concurrent"
+        binary = project.compile()
+
+    with tempfile.TemporaryDirectory(prefix="pyaket-concurrent-") as temp:
+        trace = Path(temp)/"trace.jsonl"
+        env = os.environ | dict(
+            WORKSPACE=str(Path(temp)/"workspace"),
+            PYAKET_TRACE=str(trace),
+        )
+
+        start = time.perf_counter()
+        launches = [
+            subprocess.Popen((str(binary), "-c", ""), env=env,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            for _ in range(processes)
+        ]
+        codes = [process.wait() for process in launches]
+        took = (time.perf_counter() - start)
+
+        installers = {event["pid"] for event in events(trace) if event["name"] in INSTALL}
+        waited = [event["dur"]/1000 for event in events(trace) if event["name"] == "lock"]
+
+        print(json.dumps(dict(
+            processes=processes,
+            failed=sum(code != 0 for code in codes),
+            installers=len(installers),
+            took=took,
+            max_lock_wait_ms=max(waited, default=0.0),
+        ), indent=2))
+
+        if any(codes):
+            sys.exit(f"{sum(code != 0 for code in codes)} launches failed")
+        if len(installers) != 1:
+            sys.exit(f"Expected a single installer, got {len(installers)}")
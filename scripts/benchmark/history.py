@@ -0,0 +1,206 @@
+"""
+Versioned history of benchmark results and regression detection between runs
+
+Benchmark scripts append their metrics to `history.json` (or `$PYAKET_BENCHMARK_HISTORY`),
+tagged with the machine fingerprint, pyaket version and target. Compare the last two
+runs of the same benchmark, machine and target with:
+
+- `python history.py compare [history.json]`
+- `python history.py list [history.json]`
+
+Metrics with per-run samples (hyperfine times) are compared with a one-sided
+Mann-Whitney U test, single values (size, build times) with a relative tolerance.
+Lower is always better, exits with an error on regressions to gate upgrades
+"""
+import datetime
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+import pyaket
+from attrs import define
+from pyaket import Target
+
+# Bump on incompatible changes of the entries format
+SCHEMA: int = 1
+
+Metric = Union[float, list[float]]
+
+def default_path() -> Path:
+    return Path(os.getenv("PYAKET_BENCHMARK_HISTORY", Path(__file__).parent/"history.json"))
+
+def machine() -> dict:
+    """Hardware and platform identity, results are only comparable on the same one"""
+    cpu = platform.processor()
+
+    if (cpuinfo := Path("/proc/cpuinfo")).exists():
+        for line in cpuinfo.read_text().splitlines():
+            if line.startswith("model name"):
+                cpu = line.split(":", 1)[1].strip()
+                break
+
+    info = dict(
+        system=platform.system(),
+        release=platform.release(),
+        machine=platform.machine(),
+        cpu=cpu,
+        cores=os.cpu_count(),
+        python=platform.python_version(),
+    )
+
+    # Kernel and python upgrades shouldn't split the history
+    identity = json.dumps({k: info[k] for k in ("system", "machine", "cpu", "cores")})
+    info["fingerprint"] = hashlib.sha256(identity.encode()).hexdigest()[:16]
+    return info
+
+def load(path: Optional[Path]=None) -> list[dict]:
+    try:
+        entries = json.loads((path or default_path()).read_text("utf-8"))
+    except FileNotFoundError:
+        return list()
+    return [entry for entry in entries if entry.get("schema") == SCHEMA]
+
+def record(benchmark: str, metrics: dict[str, Metric], path: Optional[Path]=None) -> dict:
+    """Append a benchmark's flat metrics to the history, returns the new entry"""
+    path = (path or default_path())
+    entries = load(path)
+    entries.append(entry := dict(
+        schema=SCHEMA,
+        benchmark=benchmark,
+        date=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        pyaket=pyaket.__version__,
+        target=Target.host().value,
+        machine=machine(),
+        metrics=metrics,
+    ))
+    path.write_text(json.dumps(entries, indent=2))
+    return entry
+
+# ---------------------------------------------------------------------------- #
+
+def mannwhitney(baseline: list[float], candidate: list[float]) -> float:
+    """
+    One-sided p-value of the candidate being greater than the baseline, normal
+    approximation of the Mann-Whitney U test with tie correction
+    """
+    n1, n2 = len(baseline), len(candidate)
+    values = sorted((value, group) for group, sample in enumerate((baseline, candidate)) for value in sample)
+
+    # Average ranks of ties
+    ranks, ties, index = [0.0]*len(values), 0.0, 0
+    while index < len(values):
+        end = index
+        while (end + 1 < len(values)) and (values[end + 1][0] == values[index][0]):
+            end += 1
+        for position in range(index, end + 1):
+            ranks[position] = (index + end) / 2 + 1
+        ties += (count := end - index + 1)**3 - count
+        index = end + 1
+
+    rank = sum(ranks[i] for i, (_, group) in enumerate(values) if group == 1)
+    u = rank - n2*(n2 + 1)/2
+    n = (n1 + n2)
+    sigma = math.sqrt((n1*n2/12) * ((n + 1) - ties/(n*(n - 1))))
+
+    if sigma == 0:
+        return 1.0
+
+    z = (u - n1*n2/2 - 0.5) / sigma
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+@define
+class Change:
+    metric: str
+    baseline: float
+    candidate: float
+    pvalue: Optional[float] = None
+
+    @property
+    def ratio(self) -> float:
+        return (self.candidate / self.baseline) if self.baseline else 1.0
+
+def compare(
+    baseline: dict,
+    candidate: dict,
+    alpha: float=0.01,
+    tolerance: float=0.02,
+) -> list[Change]:
+    """Metrics of the candidate significantly worse than the baseline, and by more than tolerance"""
+    regressions = list()
+
+    for name, new in candidate["metrics"].items():
+        if (old := baseline["metrics"].get(name)) is None:
+            continue
+
+        if isinstance(new, list) and isinstance(old, list):
+            change = Change(name, statistics.median(old), statistics.median(new),
+                pvalue=mannwhitney(old, new))
+            if (change.pvalue < alpha) and (change.ratio > 1 + tolerance):
+                regressions.append(change)
+
+        elif isinstance(new, (int, float)) and isinstance(old, (int, float)):
+            change = Change(name, old, new)
+            if (change.ratio > 1 + tolerance):
+                regressions.append(change)
+
+    return regressions
+
+def latest(entries: list[dict]) -> Optional[tuple[dict, dict]]:
+    """The last entry and the previous one of the same benchmark, machine and target"""
+    if not entries:
+        return None
+
+    def key(entry: dict) -> tuple:
+        return (entry["benchmark"], entry["machine"]["fingerprint"], entry["target"])
+
+    candidate = entries[-1]
+    for entry in reversed(entries[:-1]):
+        if key(entry) == key(candidate):
+            return (entry, candidate)
+    return None
+
+# ---------------------------------------------------------------------------- #
+
+if __name__ == "__main__":
+    command = (sys.argv[1] if len(sys.argv) > 1 else "compare")
+    entries = load(Path(sys.argv[2]) if len(sys.argv) > 2 else None)
+
+    if command == "list":
+        for entry in entries:
+            print((
+                f"{entry['date'][:19]} {entry['benchmark'].ljust(10)} "
+                f"v{entry['pyaket']} {entry['target']} ({entry['machine']['fingerprint']})"
+            ))
+
+    elif command == "compare":
+        if (pair := latest(entries)) is None:
+            sys.exit("Not enough comparable entries in the history")
+
+        baseline, candidate = pair
+        print(f"### {candidate['benchmark']}: v{baseline['pyaket']} → v{candidate['pyaket']}")
+        print("")
+
+        if not (regressions := compare(baseline, candidate)):
+            print("No significant regressions")
+            sys.exit(0)
+
+        print("| Metric               | Baseline   | Candidate  | Change  | p-value |")
+        print("| :------------------- | ---------: | ---------: | ------: | ------: |")
+        for change in regressions:
+            print((
+                f"| {change.metric.ljust(20)} "
+                f"| {change.baseline:10.4f} "
+                f"| {change.candidate:10.4f} "
+                f"| {(change.ratio - 1)*100:+6.1f}% "
+                f"| {(f'{change.pvalue:.4f}' if change.pvalue is not None else '-'):>7} |"
+            ))
+        sys.exit(1)
+
+    else:
+        sys.exit(f"Usage: {sys.argv[0]} [compare|list] [history.json]")
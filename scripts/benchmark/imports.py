@@ -0,0 +1,107 @@
+"""
+Measure import times of pyaket modules with `python -X importtime`
+
+Each statement runs in a fresh interpreter many times, reporting the
+median self and cumulative time of the interesting modules
+
+Exits with an error if any budgeted statement is slower than allowed,
+guarding `pyaket --version` and `import pyaket` against heavy imports
+"""
+import re
+import statistics
+import subprocess
+import sys
+
+from attrs import Factory, define
+
+
+@define
+class Imports:
+    statement: str
+    modules: tuple[str, ...]
+    runs: int = 30
+    title: str = ""
+
+    # Maximum median cumulative milliseconds of the first module
+    budget: float = float("inf")
+
+    # Module name -> list of (self, cumulative) microseconds
+    samples: dict = Factory(dict)
+
+    def run(self) -> "Imports":
+        for _ in range(self.runs):
+            stderr = subprocess.run(
+                (sys.executable, "-X", "importtime", "-c", self.statement),
+                capture_output=True, text=True, check=True,
+            ).stderr
+
+            for line in stderr.splitlines():
+                if not (match := re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)", line)):
+                    continue
+                if (name := match.group(4)) in self.modules:
+                    self.samples.setdefault(name, []).append((
+                        int(match.group(1)),
+                        int(match.group(2)),
+                    ))
+        return self
+
+    def median(self, module: str, index: int) -> float:
+        return statistics.median(x[index] for x in self.samples.get(module, [(0, 0)]))
+
+    def table(self) -> None:
+        print(f"#### {self.title or self.statement}")
+        print("")
+        print("| Module             | Self     | Cumulative |")
+        print("| :----------------- | -------: | ---------: |")
+        for module in self.modules:
+            print((
+                f"| {module.ljust(18)} "
+                f"| {self.median(module, 0)/1000:5.2f} ms "
+                f"| {self.median(module, 1)/1000:7.2f} ms |"
+            ))
+        print("")
+
+    @property
+    def ok(self) -> bool:
+        return (self.median(self.modules[0], 1)/1000 <= self.budget)
+
+if __name__ == "__main__":
+    budgeted = (
+        Imports(
+            title="Import pyaket (budget 40 ms)",
+            statement="import pyaket",
+            modules=("pyaket",),
+            budget=40,
+        ),
+        Imports(
+            title="Command pyaket --version (budget 40 ms)",
+            statement="import sys; sys.argv[1:] = ['--version']; import pyaket.__main__ as cli; cli.main()",
+            modules=("pyaket.__main__", "pyaket"),
+            budget=40,
+        ),
+    )
+
+    for benchmark in budgeted:
+        benchmark.run().table()
+
+    Imports(
+        title="Import targets",
+        statement="import pyaket.targets",
+        modules=("pyaket.targets",),
+    ).run().table()
+
+    # First lookup loads the compact index, not the full specs
+    Imports(
+        title="First target lookup",
+        statement=(
+            "import sys, time, pyaket.targets as t;"
+            "start=time.perf_counter();"
+            "t.Target.x86_64_pc_windows_gnu.exe_suffix;"
+            "print(f'import time: {int((time.perf_counter()-start)*1e6)} | 0 | lookup', file=sys.stderr)"
+        ),
+        modules=("lookup",),
+    ).run().table()
+
+    for benchmark in budgeted:
+        if not benchmark.ok:
+            sys.exit(f"Over budget: {benchmark.title}")
@@ -14,21 +14,22 @@ Estimated total time:
 - Apple M2 Pro:  ~30 minutes
 """
 import contextlib
-import json
+import os
 import subprocess
 import sys
 import tempfile
 import time
-from pathlib import Path
 from typing import Callable, Generator, Self
 
+import history
 import pyaket
 from attrs import Factory, define
 from pyaket import (
     CargoProfile,
-    PyaketBuild,
     PyaketProject,
+    Target,
 )
+from wheelhouse import hyperfine
 
 
 @contextlib.contextmanager
@@ -43,12 +44,18 @@ class Benchmark:
     warm: float = 0.0
     size: float = 0.0
 
+    # Peak resident memory in MB of a first run (install) and a warm run
+    bootstrap_rss: float = 0.0
+    startup_rss: float = 0.0
+
     baseline: dict = Factory(dict)
     overhead: dict = Factory(dict)
+    slowpath: dict = Factory(dict)
 
     def run(self) -> Self:
         project = PyaketProject()
         project.build.profile = self.profile
+        project.build.cache = False
         subprocess.check_call(("rustup", "default", "stable"))
         subprocess.check_call(("rustup", "update", "stable"))
         subprocess.check_call(("cargo", "fetch", "--manifest-path", str(pyaket.manifest)))
@@ -70,50 +77,47 @@ class Benchmark:
         # Measure overhead
         self.baseline = self.hyperfine(sys.executable, "-c", "")
         self.overhead = self.hyperfine(release, "-c", "")
+        self.slowpath = self.hyperfine(release, "-c", "", env=dict(PYAKET_FAST="0"))
 
-        return self
+        # Measure peak memory of installing on a fresh workspace, then a warm start
+        with tempfile.TemporaryDirectory(prefix="pyaket-workspace-") as workspace:
+            env = dict(WORKSPACE=workspace)
+            self.bootstrap_rss = self.maxrss(release, "-c", "", env=env)
+            self.startup_rss = self.maxrss(release, "-c", "", env=env)
 
-    def hyperfine(self,
-        *benchmark: str,
-        warmup: int=50,
-        runs: int=100
-    ) -> dict:
-        command = tuple()
-
-        # Linux/macOS can set niceness
-        if sys.platform in ("linux", "darwin"):
-            command += ("nice", "-20")
-
-        # Linux can pin to a specific core
-        # - Reduce jitter by avoiding migrations (core, ccd)
-        # - Avoid core 0 as it may handle kernel interrupts
-        # - Find second physical core, as core 1 might be SMT/HT
-        if sys.platform == "linux":
-            for cpu in Path("/sys/devices/system/cpu").glob("cpu[0-9]*"):
-                if int((cpu/"topology"/"core_id").read_text()) == 1:
-                    command += ("taskset", "--cpu", cpu.name.removeprefix("cpu"))
-                    break
-
-        # Convert arguments to shell string
-        benchmark = ' '.join(f'"{x}"' for x in benchmark)
-
-        with tempfile.NamedTemporaryFile(
-            prefix="pyaket-hyperfine-",
-            suffix=".json",
-            mode="w+b",
-        ) as results:
-            subprocess.check_call((
-                "hyperfine",
-                "--warmup", str(warmup),
-                "--runs", str(runs),
-                "--shell=none",
-                "--export-json",
-                str(results.name),
-                benchmark
-            ))
+        return self
 
-            results.seek(0)
-            return json.load(results)
+    def maxrss(self, *command: str, env: dict=None) -> float:
+        """Peak resident memory in MB of a command and its waited-for children"""
+        process = subprocess.Popen(
+            tuple(map(str, command)),
+            env=(os.environ | (env or {})),
+            stdout=subprocess.DEVNULL,
+        )
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command)
+
+        # Linux reports kilobytes, macOS reports bytes
+        scale = (1 if (sys.platform == "darwin") else 1024)
+        return (usage.ru_maxrss * scale) / (1000 * 1000)
+
+    def hyperfine(self, *benchmark: str, **options) -> dict:
+        return hyperfine(*benchmark, **options)
+
+    def metrics(self) -> dict:
+        """Flat metrics for the history, lower is better"""
+        name = self.profile.value
+        return {
+            f"{name}.size":    self.size,
+            f"{name}.cold":    self.cold,
+            f"{name}.warm":    self.warm,
+            f"{name}.startup": self.overhead["results"][0]["times"],
+            f"{name}.uvrun":   self.slowpath["results"][0]["times"],
+            f"{name}.rss":     self.bootstrap_rss,
+        }
 
     @property
     def mean(self) -> float:
@@ -122,6 +126,14 @@ class Benchmark:
             self.baseline["results"][0]["mean"]*(-1),
         ))
 
+    @property
+    def slowmean(self) -> float:
+        """Overhead without the direct interpreter fast path (uv run)"""
+        return sum((
+            self.slowpath["results"][0]["mean"],
+            self.baseline["results"][0]["mean"]*(-1),
+        ))
+
 @define
 class Benchmarker:
     samples: list[Benchmark] = Factory(list)
@@ -133,19 +145,26 @@ class Benchmarker:
             self.table()
 
     def table(self) -> str:
-        print(f"### {PyaketBuild.host()}")
+        print(f"### {Target.host().value}")
         print("")
-        print("| Profile  | Size     | Startup | Cold    | Warm    |")
-        print("| :------- | -------: | ------: | ------: | ------: |")
+        print("| Profile  | Size     | Startup | uv run   | Cold    | Warm    | Install RSS | Startup RSS |")
+        print("| :------- | -------: | ------: | -------: | ------: | ------: | ----------: | ----------: |")
         for sample in self.samples:
             print((
                 f"| {sample.profile.value.ljust(8)} "
                 f"| {sample.size:5.2f} MB "
                 f"| {sample.mean*1000:4.1f} ms "
+                f"| {sample.slowmean*1000:5.1f} ms "
                 f"| {sample.cold:5.1f} s "
-                f"| {sample.warm:5.1f} s |"
+                f"| {sample.warm:5.1f} s "
+                f"| {sample.bootstrap_rss:8.1f} MB "
+                f"| {sample.startup_rss:8.1f} MB |"
             ))
 
 if __name__ == "__main__":
     app = Benchmarker()
     app.run()
+    history.record("profiles", {
+        key: value for sample in app.samples
+        for key, value in sample.metrics().items()
+    })
@@ -0,0 +1,80 @@
+"""
+Launch latency of rolling dependencies, upgraded at every launch versus time-boxed and background refreshes
+
+Wheels: `pip rich`, see `wheelhouse.py` for the setup. Every launch of the default
+mode resolves against the local index. The environment is installed once before
+measuring warm launches
+"""
+import tempfile
+from pathlib import Path
+from typing import Iterator, Self
+
+from attrs import Factory, define
+from pyaket import PyaketProject
+from wheelhouse import Suite, hyperfine, main, offline
+
+# Pairs of (name, ttl, background)
+MODES: tuple[tuple[str, int, bool], ...] = (
+    ("static",     0,    False),
+    ("rolling",    0,    False),
+    ("ttl",        3600, False),
+    ("background", 0,    True),
+)
+
+@define
+class Rolling:
+    index: str
+    name: str
+    ttl: int = 0
+    background: bool = False
+    pypi: tuple[str, ...] = ("rich",)
+    runs: int = 20
+
+    warm: dict = Factory(dict)
+
+    def run(self) -> Self:
+        project = PyaketProject()
+        project.app.name = f"rolling-{self.name}"
+        project.deps.pypi = list(self.pypi)
+        project.deps.rolling = (self.name != "static")
+        project.deps.rolling_ttl = self.ttl
+        project.deps.rolling_background = self.background
+        release = project.compile()
+
+        with tempfile.TemporaryDirectory(prefix="pyaket-rolling-") as temp:
+            env = offline(self.index) | dict(
+                WORKSPACE=str(Path(temp)/"workspace"),
+                UV_CACHE_DIR=str(Path(temp)/"cache"),
+            )
+
+            self.warm = hyperfine(release, "-c", "",
+                warmup=3, runs=self.runs,
+                env=env,
+            )["results"][0]
+
+        return self
+
+    def metrics(self) -> dict:
+        return {f"{self.name}.warm": self.warm["times"]}
+
+    def results(self) -> dict:
+        return dict(mode=self.name, ttl=self.ttl, background=self.background, warm=self.warm)
+
+@define
+class Rollings(Suite):
+    columns = (
+        ("Mode",   10, "<"),
+        ("Mean",   9,  ">"),
+        ("Median", 9,  ">"),
+        ("Max",    9,  ">"),
+    )
+
+    def sweep(self, index: str) -> Iterator[Rolling]:
+        for name, ttl, background in MODES:
+            yield Rolling(index, name, ttl, background).run()
+
+    def row(self, sample: Rolling) -> tuple[str, ...]:
+        return (sample.name, *(f"{sample.warm[key]*1000:6.1f} ms" for key in ("mean", "median", "max")))
+
+if __name__ == "__main__":
+    main(Rollings, "rolling")
@@ -0,0 +1,207 @@
+"""
+Shared harness of the benchmarks launching binaries with real dependencies, offline
+
+1. Prepare a directory of wheels the benchmark needs, plus pip for `uv venv --seed`:
+  - `pip download -d wheelhouse pip (packages)`
+
+2. Install the python version once, runs don't download it again:
+  - `uv python install 3.14`
+
+3. Run `python (benchmark).py wheelhouse [results.json]`
+
+A local PEP 503 index is served from the wheelhouse, no network is used. Results
+are exported as json and recorded in the history, see `history.py`
+"""
+import contextlib
+import functools
+import http.server
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import ClassVar, Generator, Iterator
+
+import history
+import pyaket
+from attrs import Factory, define
+from pyaket import Target
+
+
+def hyperfine(
+    *benchmark: str,
+    warmup: int=50,
+    runs: int=100,
+    env: dict=None,
+) -> dict:
+    command = tuple()
+
+    # Linux/macOS can set niceness
+    if sys.platform in ("linux", "darwin"):
+        command += ("nice", "-20")
+
+    # Linux can pin to a specific core
+    # - Reduce jitter by avoiding migrations (core, ccd)
+    # - Avoid core 0 as it may handle kernel interrupts
+    # - Find second physical core, as core 1 might be SMT/HT
+    if sys.platform == "linux":
+        for cpu in Path("/sys/devices/system/cpu").glob("cpu[0-9]*"):
+            if int((cpu/"topology"/"core_id").read_text()) == 1:
+                command += ("taskset", "--cpu", cpu.name.removeprefix("cpu"))
+                break
+
+    # Convert arguments to shell string
+    benchmark = ' '.join(f'"{x}"' for x in benchmark)
+
+    with tempfile.NamedTemporaryFile(
+        prefix="pyaket-hyperfine-",
+        suffix=".json",
+        mode="w+b",
+    ) as results:
+
+        # Benchmarked commands inherit niceness and affinity
+        subprocess.check_call((
+            *command, "hyperfine",
+            "--warmup", str(warmup),
+            "--runs", str(runs),
+            "--shell=none",
+            "--export-json",
+            str(results.name),
+            benchmark
+        ), env=(os.environ | (env or {})))
+
+        results.seek(0)
+        return json.load(results)
+
+def stats(times: list[float]) -> dict:
+    """Same shape as hyperfine's exported results"""
+    return dict(
+        mean=statistics.mean(times),
+        stddev=(statistics.stdev(times) if len(times) > 1 else 0.0),
+        median=statistics.median(times),
+        min=min(times),
+        max=max(times),
+        times=times,
+    )
+
+# ---------------------------------------------------------------------------- #
+
+def normalize(name: str) -> str:
+    """PEP 503 normalized project name"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def distribution(file: Path) -> str:
+    """Project name of a wheel or sdist file"""
+    if file.suffix == ".whl":
+        return normalize(file.name.split("-")[0])
+    return normalize(file.name.removesuffix(".tar.gz").rsplit("-", 1)[0])
+
+def offline(index: str) -> dict:
+    """Environment of launches installing from the local index only"""
+    return dict(
+        UV_DEFAULT_INDEX=index,
+        UV_PYTHON_DOWNLOADS="never",
+    )
+
+@contextlib.contextmanager
+def local_index(wheelhouse: Path) -> Generator[str, None, None]:
+    """Serve a PEP 503 simple index of a directory's files, yields its url"""
+    with tempfile.TemporaryDirectory(prefix="pyaket-index-") as root:
+        simple = Path(root)/"simple"
+        packages: dict[str, list[Path]] = dict()
+
+        for file in (*wheelhouse.glob("*.whl"), *wheelhouse.glob("*.tar.gz")):
+            packages.setdefault(distribution(file), []).append(file)
+
+        for name, files in packages.items():
+            (project := simple/name).mkdir(parents=True)
+            for file in files:
+                os.symlink(file.resolve(), project/file.name)
+            (project/"index.html").write_text("\n".join((
+                "<!DOCTYPE html><html><body>",
+                *(f'<a href="{file.name}">{file.name}</a><br/>' for file in files),
+                "</body></html>",
+            )))
+
+        (simple/"index.html").write_text("\n".join((
+            "<!DOCTYPE html><html><body>",
+            *(f'<a href="{name}/">{name}</a><br/>' for name in packages),
+            "</body></html>",
+        )))
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0),
+            functools.partial(Handler, directory=root))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            yield f"http://127.0.0.1:{server.server_port}/simple"
+        finally:
+            server.shutdown()
+
+# ---------------------------------------------------------------------------- #
+
+@define
+class Suite:
+    """Samples of a benchmark over the local index, subclasses only measure"""
+    wheelhouse: Path
+    samples: list = Factory(list)
+
+    # Title, width and alignment ('<' or '>') of the table's columns
+    columns: ClassVar[tuple[tuple[str, int, str], ...]] = tuple()
+
+    def sweep(self, index: str) -> Iterator:
+        """Measure and yield every sample against the index"""
+        raise NotImplementedError
+
+    def row(self, sample) -> tuple[str, ...]:
+        """Formatted cells of a sample, per column"""
+        raise NotImplementedError
+
+    def run(self) -> None:
+        with local_index(self.wheelhouse) as index:
+            for sample in self.sweep(index):
+                self.samples.append(sample)
+                self.table()
+
+    def table(self) -> None:
+        print(f"### {Target.host().value}")
+        print("")
+        print("| " + " | ".join(f"{title:{align}{width}}" for title, width, align in self.columns) + " |")
+        print("| " + " | ".join((":" + "-"*(width - 1)) if (align == "<") else ("-"*(width - 1) + ":")
+            for _, width, align in self.columns) + " |")
+        for sample in self.samples:
+            print("| " + " | ".join(f"{cell:{align}{width}}"
+                for cell, (_, width, align) in zip(self.row(sample), self.columns)) + " |")
+
+    def metrics(self) -> dict:
+        """Flat metrics for the history, lower is better"""
+        return {
+            key: value for sample in self.samples
+            for key, value in sample.metrics().items()
+        }
+
+    def export(self, path: Path) -> None:
+        path.write_text(json.dumps(dict(
+            pyaket=pyaket.__version__,
+            target=Target.host().value,
+            samples=[sample.results() for sample in self.samples],
+        ), indent=2))
+
+def main(suite: type[Suite], name: str) -> None:
+    """Run a benchmark from the command line, export and record it"""
+    if len(sys.argv) < 2:
+        sys.exit(f"Usage: {sys.argv[0]} <wheelhouse> [results.json]")
+
+    app = suite(wheelhouse=Path(sys.argv[1]))
+    app.run()
+    app.export(Path(sys.argv[2] if len(sys.argv) > 2 else f"{name}.json"))
+    history.record(name, app.metrics())
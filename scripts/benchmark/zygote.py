@@ -0,0 +1,79 @@
+"""
+Warm launch latency of a module entry with heavy imports, direct versus forked from a zygote
+
+Wheels: `pip numpy rich`, see `wheelhouse.py` for the setup. The entry module is
+the preloaded package itself, the first launches start the zygote and are excluded
+as hyperfine warmups
+"""
+import tempfile
+from pathlib import Path
+from typing import Iterator, Self
+
+from attrs import Factory, define
+from pyaket import PyaketProject
+from wheelhouse import Suite, hyperfine, main, offline
+
+# Package with a __main__ module, imports measured per launch
+APP: tuple[str, tuple[str, ...]] = ("rich", ("numpy", "rich", "rich.console"))
+
+@define
+class Zygote:
+    index: str
+    zygote: bool = False
+    runs: int = 50
+
+    warm: dict = Factory(dict)
+
+    @property
+    def name(self) -> str:
+        return ("zygote" if self.zygote else "direct")
+
+    def run(self) -> Self:
+        module, preload = APP
+        project = PyaketProject()
+        project.app.name = f"zygote-{self.name}"
+        project.deps.pypi = list(preload[:2])
+        project.entry.module = module
+        project.entry.zygote = self.zygote
+        project.entry.preload = list(preload)
+        project.entry.idle = 60
+        release = project.compile()
+
+        with tempfile.TemporaryDirectory(prefix="pyaket-zygote-") as temp:
+            env = offline(self.index) | dict(
+                WORKSPACE=str(Path(temp)/"workspace"),
+                UV_CACHE_DIR=str(Path(temp)/"cache"),
+            )
+
+            # Renders rich's demo, the output is discarded
+            self.warm = hyperfine(release,
+                warmup=5, runs=self.runs,
+                env=env,
+            )["results"][0]
+
+        return self
+
+    def metrics(self) -> dict:
+        return {f"{self.name}.warm": self.warm["times"]}
+
+    def results(self) -> dict:
+        return dict(launch=self.name, warm=self.warm)
+
+@define
+class Zygotes(Suite):
+    columns = (
+        ("Launch", 8, "<"),
+        ("Mean",   9, ">"),
+        ("Median", 9, ">"),
+        ("Max",    9, ">"),
+    )
+
+    def sweep(self, index: str) -> Iterator[Zygote]:
+        for zygote in (False, True):
+            yield Zygote(index, zygote).run()
+
+    def row(self, sample: Zygote) -> tuple[str, ...]:
+        return (sample.name, *(f"{sample.warm[key]*1000:6.1f} ms" for key in ("mean", "median", "max")))
+
+if __name__ == "__main__":
+    main(Zygotes, "zygote")